@@ -3,10 +3,9 @@
 from django.views import generic
 from django.http import JsonResponse, Http404
 from django.shortcuts import get_object_or_404
-from django.template.loader import render_to_string
-from django.utils.timezone import now
+from django.utils.cache import get_conditional_response, patch_cache_control
 from ara_ako.models import AraAkoEvent
-from events.utils import organise_schedule_data
+from events.utils import get_event_schedule
 
 
 class AraAkoHomeView(generic.ListView):
@@ -48,33 +47,31 @@ def dashboard_json(request, **kwargs):
         request: The HTTP request.
 
     Returns:
-        JSON response is sent containing data for the requested dashboard.
+        JSON response is sent containing data for the requested dashboard,
+        or a 304 response if the schedule matches the request's ETag.
     """
     # If term parameter, then return JSON
     if "slug" in request.GET:
         event_slug = request.GET.get("slug")
         ara_ako_event = get_object_or_404(
-            AraAkoEvent,
+            AraAkoEvent.objects.select_related('event'),
             slug=event_slug
         )
 
-        # Get sessions
-        sessions = ara_ako_event.event.sessions.filter(
-            end__gte=now()
-        ).prefetch_related(
-            'locations'
-        )
-        # Organise sessions
-        context = {
-            'schedule': organise_schedule_data(sessions)
-        }
-        # Render as HTML
-        html = render_to_string('events/event_schedule.html', context)
-        # Prepare JSON data
-        data = {
-            "slug": event_slug,
-            "schedule_html": html,
-        }
-        return JsonResponse(data)
+        # Get rendered schedule of upcoming sessions
+        schedule = get_event_schedule(ara_ako_event.event, upcoming_only=True)
+        response = get_conditional_response(request, etag=schedule['etag'])
+        if response is None:
+            # Prepare JSON data
+            data = {
+                "slug": event_slug,
+                "schedule_html": schedule['html'],
+                "next_change": schedule['next_change'],
+            }
+            response = JsonResponse(data)
+        response['ETag'] = schedule['etag']
+        # Browsers revalidate with the ETag on each poll
+        patch_cache_control(response, no_cache=True)
+        return response
     else:
         raise Http404("Event slug parameter not found.")
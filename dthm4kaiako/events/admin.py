@@ -147,12 +147,6 @@ class EventAdmin(ClonableModelAdmin):
     autocomplete_fields = ('locations', )
     save_on_top = True
 
-    def save_related(self, request, form, formsets, change):
-        """Trigger update of event datetimes after sessions are saved."""
-        super().save_related(request, form, formsets, change)
-        # Update datetimes on event after saving sessions
-        form.instance.update_datetimes()
-
     class Media:
         """Custom media file overrides."""
 
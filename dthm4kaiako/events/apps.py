@@ -8,3 +8,7 @@ class EventsAppConfig(AppConfig):
 
     name = 'events'
     verbose_name = 'Event Hub'
+
+    def ready(self):
+        """Import signals once application is ready."""
+        from events import signals  # noqa
@@ -1,6 +1,7 @@
 """Filters for events application."""
 
 import django_filters
+from django.db.models import Exists, OuterRef
 from django.utils.timezone import now
 from events.models import (
     Event,
@@ -9,6 +10,26 @@ from events.models import (
 from users.models import Entity
 
 
+def filter_by_region(queryset, name, value):
+    """Filter events to those with a location in the given region.
+
+    An EXISTS subquery is used, avoiding duplicate events from joins.
+    """
+    return queryset.filter(Exists(
+        Event.locations.through.objects.filter(event=OuterRef('pk'), location__region=value)
+    ))
+
+
+def filter_by_organiser(queryset, name, value):
+    """Filter events to those organised by the given entity.
+
+    An EXISTS subquery is used, avoiding duplicate events from joins.
+    """
+    return queryset.filter(Exists(
+        Event.organisers.through.objects.filter(event=OuterRef('pk'), entity=value)
+    ))
+
+
 class UpcomingEventFilter(django_filters.FilterSet):
     """Filter for showing upcoming events."""
 
@@ -16,6 +37,7 @@ class UpcomingEventFilter(django_filters.FilterSet):
         choices=Location.REGION_CHOICES,
         label='Region',
         empty_label='Show all',
+        method=filter_by_region,
     )
     accessible_online = django_filters.ChoiceFilter(
         choices=(
@@ -28,6 +50,7 @@ class UpcomingEventFilter(django_filters.FilterSet):
         queryset=Entity.objects.all(),
         label='Organiser',
         empty_label='Show all',
+        method=filter_by_organiser,
     )
 
     class Meta:
@@ -48,13 +71,13 @@ class UpcomingEventFilter(django_filters.FilterSet):
             published=True
         ).filter(
             end__gte=now()
-        ).order_by('start').prefetch_related(
+        ).order_by('start', 'pk').prefetch_related(
             'organisers',
             'locations',
             'sponsors',
         ).select_related(
             'series',
-        ).distinct()
+        )
 
 
 class PastEventFilter(django_filters.FilterSet):
@@ -64,6 +87,7 @@ class PastEventFilter(django_filters.FilterSet):
         choices=Location.REGION_CHOICES,
         label='Region',
         empty_label='Show all',
+        method=filter_by_region,
     )
     accessible_online = django_filters.ChoiceFilter(
         choices=(
@@ -76,6 +100,7 @@ class PastEventFilter(django_filters.FilterSet):
         queryset=Entity.objects.all(),
         label='Organiser',
         empty_label='Show all',
+        method=filter_by_organiser,
     )
 
     class Meta:
@@ -95,10 +120,10 @@ class PastEventFilter(django_filters.FilterSet):
             published=True
         ).filter(
             end__lt=now()
-        ).order_by('-end').prefetch_related(
+        ).order_by('-end', '-pk').prefetch_related(
             'organisers',
             'locations',
             'sponsors',
         ).select_related(
             'series',
-        ).distinct()
+        )
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.13 on 2026-10-18 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0019_auto_20220406_1005'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['published', 'end'], name='events_even_publish_c02f62_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['published', 'start'], name='events_even_publish_284f17_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.13 on 2026-10-18 12:40
+
+import django.contrib.gis.db.models.fields
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0020_event_published_datetime_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='location',
+            index=django.contrib.postgres.indexes.GistIndex(
+                django.db.models.functions.comparison.Cast(
+                    'coords',
+                    output_field=django.contrib.gis.db.models.fields.PointField(geography=True, srid=4326),
+                ),
+                name='location_coords_geography',
+            ),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.13 on 2026-10-18 13:25
+
+from django.db import migrations, models
+
+
+def update_location_summaries(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    events = list(Event.objects.prefetch_related('locations'))
+    for event in events:
+        locations = list(event.locations.all())
+        event.location_count = len(locations)
+        if len(locations) > 1:
+            event.location_summary = 'Multiple locations'
+        elif locations:
+            location = locations[0]
+            event.location_summary = '{}, {}'.format(location.city, location.get_region_display())
+    Event.objects.bulk_update(events, ['location_summary', 'location_count'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0021_location_coords_geography_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='location_count',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='location_summary',
+            field=models.CharField(blank=True, editable=False, max_length=300),
+        ),
+        migrations.RunPython(update_location_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.13 on 2026-10-18 13:50
+
+from django.db import migrations
+
+# Statement level triggers update event datetimes once per statement
+# writing sessions, including bulk writes that do not send signals.
+CREATE_TRIGGERS_SQL = '''
+CREATE FUNCTION events_update_event_datetimes(event_ids bigint[]) RETURNS void AS $$
+    UPDATE events_event SET
+        "start" = (SELECT MIN(s."start") FROM events_session s WHERE s.event_id = events_event.id),
+        "end" = (SELECT MAX(s."end") FROM events_session s WHERE s.event_id = events_event.id)
+    WHERE events_event.id = ANY(event_ids);
+$$ LANGUAGE sql;
+
+CREATE FUNCTION events_session_datetimes_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM events_update_event_datetimes(ARRAY(SELECT DISTINCT event_id FROM new_sessions));
+    ELSIF TG_OP = 'UPDATE' THEN
+        PERFORM events_update_event_datetimes(ARRAY(
+            SELECT event_id FROM new_sessions UNION SELECT event_id FROM old_sessions
+        ));
+    ELSE
+        PERFORM events_update_event_datetimes(ARRAY(SELECT DISTINCT event_id FROM old_sessions));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER events_session_insert_datetimes
+    AFTER INSERT ON events_session
+    REFERENCING NEW TABLE AS new_sessions
+    FOR EACH STATEMENT EXECUTE FUNCTION events_session_datetimes_trigger();
+
+CREATE TRIGGER events_session_update_datetimes
+    AFTER UPDATE ON events_session
+    REFERENCING OLD TABLE AS old_sessions NEW TABLE AS new_sessions
+    FOR EACH STATEMENT EXECUTE FUNCTION events_session_datetimes_trigger();
+
+CREATE TRIGGER events_session_delete_datetimes
+    AFTER DELETE ON events_session
+    REFERENCING OLD TABLE AS old_sessions
+    FOR EACH STATEMENT EXECUTE FUNCTION events_session_datetimes_trigger();
+'''
+
+DROP_TRIGGERS_SQL = '''
+DROP TRIGGER events_session_insert_datetimes ON events_session;
+DROP TRIGGER events_session_update_datetimes ON events_session;
+DROP TRIGGER events_session_delete_datetimes ON events_session;
+DROP FUNCTION events_session_datetimes_trigger();
+DROP FUNCTION events_update_event_datetimes(bigint[]);
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0022_event_location_summary'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_TRIGGERS_SQL, DROP_TRIGGERS_SQL),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.13 on 2026-10-19 09:30
+
+from django.db import migrations, models
+
+# Event datetimes updated from sessions also mark the event as modified,
+# using the current time rather than the start of the transaction.
+UPDATE_FUNCTION_SQL = '''
+CREATE OR REPLACE FUNCTION events_update_event_datetimes(event_ids bigint[]) RETURNS void AS $$
+    UPDATE events_event SET
+        "start" = (SELECT MIN(s."start") FROM events_session s WHERE s.event_id = events_event.id),
+        "end" = (SELECT MAX(s."end") FROM events_session s WHERE s.event_id = events_event.id),
+        "modified" = clock_timestamp()
+    WHERE events_event.id = ANY(event_ids);
+$$ LANGUAGE sql;
+'''
+
+REVERT_FUNCTION_SQL = '''
+CREATE OR REPLACE FUNCTION events_update_event_datetimes(event_ids bigint[]) RETURNS void AS $$
+    UPDATE events_event SET
+        "start" = (SELECT MIN(s."start") FROM events_session s WHERE s.event_id = events_event.id),
+        "end" = (SELECT MAX(s."end") FROM events_session s WHERE s.event_id = events_event.id)
+    WHERE events_event.id = ANY(event_ids);
+$$ LANGUAGE sql;
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0023_session_event_datetimes_triggers'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='modified',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='location',
+            name='modified',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='session',
+            name='modified',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunSQL(UPDATE_FUNCTION_SQL, REVERT_FUNCTION_SQL),
+    ]
@@ -3,6 +3,8 @@
 
 from django.db import models
 from django.contrib.gis.db import models as geomodels
+from django.contrib.postgres.indexes import GistIndex
+from django.db.models.functions import Cast
 from django.core.exceptions import ValidationError
 from django.urls import reverse
 from django.utils.timezone import now
@@ -82,6 +84,7 @@ class Location(models.Model):
     )
     description = HTMLField(blank=True)
     coords = geomodels.PointField()
+    modified = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         """Text representation of a location."""
@@ -113,6 +116,13 @@ class Location(models.Model):
         """Meta options for class."""
 
         ordering = ['name', ]
+        indexes = [
+            # Distances in metres are calculated on geography values
+            GistIndex(
+                Cast('coords', output_field=geomodels.PointField(geography=True)),
+                name='location_coords_geography',
+            ),
+        ]
 
 
 class Series(models.Model):
@@ -209,14 +219,30 @@ class Event(models.Model):
         null=True,
         blank=True,
     )
+    # Stored from locations by signals, to avoid querying locations per event
+    location_summary = models.CharField(max_length=300, blank=True, editable=False)
+    location_count = models.PositiveSmallIntegerField(default=0, editable=False)
+    modified = models.DateTimeField(auto_now=True)
     # TODO: Add validation that if no locations, then accessible_online must be true
     # See: https://docs.djangoproject.com/en/dev/ref/signals/#django.db.models.signals.m2m_changed
 
-    def update_datetimes(self):
-        """Update datetimes of event."""
-        self.start = self.sessions.order_by('start').first().start
-        self.end = self.sessions.order_by('-end').first().end
-        self.save()
+    # Maintained by session triggers (see migrations 0023 and 0024) and
+    # location signals, values on an instance may be older than stored.
+    STORED_FIELDS = ('start', 'end', 'location_summary', 'location_count')
+
+    def save(self, *args, **kwargs):
+        """Override save method to keep stored values of existing events.
+
+        Fields maintained by the database and signals are not written
+        when an existing event is saved, unless given in update_fields.
+        """
+        existing = self.pk is not None and not self._state.adding and not kwargs.get('force_insert')
+        if existing and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.STORED_FIELDS
+            ]
+        super().save(*args, **kwargs)
 
     def get_absolute_url(self):
         """Return URL of event on website.
@@ -237,20 +263,20 @@ class Event(models.Model):
         else:
             return self.name
 
-    def location_summary(self):
-        """Return string of event location.
+    def update_location_summary(self):
+        """Update stored summary of event locations, without saving.
 
-        Returns:
-            String of summary of event location or None if no locations.
+        The summary is blank if the event has no locations.
         """
         locations = list(self.locations.all())
+        self.location_count = len(locations)
         if len(locations) > 1:
-            return 'Multiple locations'
+            self.location_summary = 'Multiple locations'
         elif locations:
             location = locations[0]
-            return '{}, {}'.format(location.city, location.get_region_display())
+            self.location_summary = '{}, {}'.format(location.city, location.get_region_display())
         else:
-            return None
+            self.location_summary = ''
 
     @property
     def has_ended(self):
@@ -290,6 +316,10 @@ class Event(models.Model):
         """Meta options for class."""
 
         ordering = ['start', 'end']
+        indexes = [
+            models.Index(fields=['published', 'end']),
+            models.Index(fields=['published', 'start']),
+        ]
 
 
 class Session(models.Model):
@@ -311,6 +341,7 @@ class Session(models.Model):
         related_name='sessions',
         blank=True,
     )
+    modified = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         """Text representation of an session."""
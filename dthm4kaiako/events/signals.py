@@ -0,0 +1,82 @@
+"""Signals for the events application."""
+
+from django.dispatch import receiver
+from django.db.models.signals import (
+    post_save,
+    pre_delete,
+    post_delete,
+    m2m_changed,
+)
+from django.utils.timezone import now
+from events.models import (
+    Event,
+    Session,
+    Location,
+)
+from events.utils import update_event_location_summaries
+
+
+@receiver(m2m_changed, sender=Event.locations.through)
+def on_event_locations_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Update location summaries of events after their locations change.
+
+    Clearing events from the location side does not provide the
+    affected events, so these are recorded before the clear occurs.
+    """
+    event_pks = None
+    if reverse:
+        if action == 'pre_clear':
+            instance._cleared_event_pks = list(instance.events.values_list('pk', flat=True))
+        elif action == 'post_clear':
+            event_pks = getattr(instance, '_cleared_event_pks', [])
+        elif action in ('post_add', 'post_remove'):
+            event_pks = pk_set
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        event_pks = [instance.pk]
+    if event_pks:
+        update_event_location_summaries(event_pks)
+
+
+@receiver(m2m_changed, sender=Session.locations.through)
+def on_session_locations_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Mark sessions as modified after their locations change.
+
+    Clearing sessions from the location side does not provide the
+    affected sessions, so these are recorded before the clear occurs.
+    """
+    session_pks = None
+    if reverse:
+        if action == 'pre_clear':
+            instance._cleared_session_pks = list(instance.sessions.values_list('pk', flat=True))
+        elif action == 'post_clear':
+            session_pks = getattr(instance, '_cleared_session_pks', [])
+        elif action in ('post_add', 'post_remove'):
+            session_pks = pk_set
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        session_pks = [instance.pk]
+    if session_pks:
+        Session.objects.filter(pk__in=session_pks).update(modified=now())
+
+
+@receiver(post_save, sender=Location)
+def on_location_saved(sender, instance, created, **kwargs):
+    """Update location summaries of events at a changed location."""
+    if not created:
+        update_event_location_summaries(instance.events.values_list('pk', flat=True))
+
+
+@receiver(pre_delete, sender=Location)
+def on_location_pre_delete(sender, instance, **kwargs):
+    """Record events at a location before it is deleted.
+
+    Relationships are removed by the deletion without sending m2m signals.
+    """
+    instance._deleted_event_pks = list(instance.events.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Location)
+def on_location_post_delete(sender, instance, **kwargs):
+    """Update location summaries of events at a deleted location."""
+    event_pks = getattr(instance, '_deleted_event_pks', [])
+    if event_pks:
+        update_event_location_summaries(event_pks)
@@ -7,6 +7,13 @@ from events import views
 app_name = 'events'
 urlpatterns = [
     path('', views.HomeView.as_view(), name='home'),
+    path('map-locations/', views.event_map_locations_json, name='map_locations'),
+    path('map-clusters/', views.event_map_clusters_json, name='map_clusters'),
+    path('calendar.ics', views.events_calendar, name='calendar'),
+    path('series/<int:pk>/calendar.ics', views.series_events_calendar, name='series_calendar'),
+    path('region/<int:region>/calendar.ics', views.region_events_calendar, name='region_calendar'),
+    path('organiser/<int:pk>/calendar.ics', views.organiser_events_calendar, name='organiser_calendar'),
+    path('event/<int:pk>/calendar.ics', views.event_sessions_calendar, name='event_calendar'),
     path('upcoming/', views.EventUpcomingView.as_view(), name='upcoming'),
     path('past/', views.EventPastView.as_view(), name='past'),
     path('event/<int:pk>/', views.EventDetailView.as_view()),
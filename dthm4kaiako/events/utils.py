@@ -1,6 +1,20 @@
 """Utility functions for events application."""
 
-from django.utils.timezone import localdate, localtime
+from datetime import timezone
+from hashlib import md5
+from operator import attrgetter
+from django.contrib.gis.db.models import PointField
+from django.contrib.gis.db.models.aggregates import Collect
+from django.contrib.gis.db.models.functions import Centroid, Distance, SnapToGrid
+from django.contrib.gis.geos import Point, Polygon
+from django.contrib.gis.measure import D
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.db.models import Count, Max, Q
+from django.db.models.functions import Cast
+from django.urls import reverse
+from django.utils.html import format_html, strip_tags
+from django.utils.timezone import localtime, now
 from crispy_forms.helper import FormHelper
 from crispy_forms.layout import (
     Layout,
@@ -11,32 +25,57 @@ from crispy_forms.layout import (
     HTML,
     Submit,
 )
+from events.models import Event
 
 FILTER_HELPER_RESET_HTML_TEMPLATE = '<a href="{{% url "{}" %}}" class="btn btn-danger">Reset</a>'
+SCHEDULE_CACHE_KEY = 'events:schedule:{}:{}:{}'
+SCHEDULE_CACHE_TIMEOUT = 60 * 10
+MAP_AREA_MAX_RADIUS = 2000
+MAP_MAX_ZOOM = 22
+# Zoom level where individual locations are shown instead of clusters
+MAP_CLUSTER_MAX_ZOOM = 12
+# Number of cluster grid cells across one 256 pixel map tile
+MAP_CLUSTER_CELLS_PER_TILE = 4
+ICAL_PRODUCT_ID = '-//dthm4kaiako//Events//EN'
+ICAL_LINE_LENGTH = 75
 
 
 class Day():
     """Class for organising time slots in schedule."""
 
-    def __init__(self, datetime):
+    __slots__ = ('date', 'time_slots')
+
+    def __init__(self, date):
         """Create day object for tracking time slots."""
-        self.date = localdate(datetime)
+        self.date = date
         self.time_slots = []
 
 
 class TimeSlot():
     """Class for organising sessions in schedule."""
 
+    __slots__ = ('start', 'end', 'sessions')
+
     def __init__(self, start_datetime, end_datetime):
-        """Create time slot object for tracking sessions."""
-        self.start = localtime(start_datetime)
-        self.end = localtime(end_datetime)
+        """Create time slot object for tracking sessions.
+
+        Args:
+            start_datetime (datetime): Start of time slot in local time.
+            end_datetime (datetime): End of time slot in local time.
+        """
+        self.start = start_datetime
+        self.end = end_datetime
         self.sessions = []
 
 
 def organise_schedule_data(sessions):
     """Organises sessions for displaying in schedule.
 
+    Sessions are sorted by start and end (keeping the given order for
+    sessions with matching times), then grouped in a single pass.
+    Day and time slot objects are only created when a new day or time
+    slot begins.
+
     Returns:
         List of Day objects, each containing a list of TimeSlot objects, each containing a list of sessions.
 
@@ -69,33 +108,94 @@ def organise_schedule_data(sessions):
         ]
     """
     schedule_data = []
-    for session in sessions:
-        # If day list is empty or doesn't match last day, add day object.
-        session_day = Day(session.start)
-        if not schedule_data or not session_day.date == schedule_data[-1].date:
-            schedule_data.append(session_day)
-
-        # If last day's timeslot list is empty or doesn't match last
-        # timeslot, add timeslot object.
-        session_time_slot = TimeSlot(session.start, session.end)
-        previous_time_slot = None
-        if schedule_data[-1].time_slots:
-            previous_time_slot = schedule_data[-1].time_slots[-1]
-
-        if (
-            not previous_time_slot or
-            not (
-                session_time_slot.start == previous_time_slot.start and
-                session_time_slot.end == previous_time_slot.end
-            )
-        ):
-            session_time_slot.sessions.append(session)
-            schedule_data[-1].time_slots.append(session_time_slot)
-        else:
-            previous_time_slot.sessions.append(session)
+    day = None
+    time_slot_start = None
+    time_slot_end = None
+    for session in sorted(sessions, key=attrgetter('start', 'end')):
+        # Sessions in the same time slot share the local time conversion.
+        if session.start != time_slot_start or session.end != time_slot_end:
+            time_slot_start = session.start
+            time_slot_end = session.end
+            start = localtime(time_slot_start)
+            date = start.date()
+            # If no day or session is on a different day, add day object.
+            if day is None or day.date != date:
+                day = Day(date)
+                schedule_data.append(day)
+            time_slot = TimeSlot(start, localtime(time_slot_end))
+            day.time_slots.append(time_slot)
+        time_slot.sessions.append(session)
     return schedule_data
 
 
+def get_schedule_state(event):
+    """Return state of sessions shown in the schedule of an event.
+
+    The state is read from the database in one query, so every server
+    process sees the same state when sessions or their locations
+    change. The number of location relationships changes when a
+    location of a session is deleted.
+
+    Args:
+        event (Event): Event to read state of.
+
+    Returns:
+        Tuple of number of sessions, number of session location
+        relationships, and latest modified datetimes of sessions and
+        their locations.
+    """
+    state = event.sessions.order_by().aggregate(
+        count=Count('pk', distinct=True),
+        location_count=Count('locations'),
+        modified=Max('modified'),
+        locations_modified=Max('locations__modified'),
+    )
+    return (state['count'], state['location_count'], state['modified'], state['locations_modified'])
+
+
+def get_event_schedule(event, upcoming_only=False):
+    """Return rendered schedule of sessions of an event.
+
+    The schedule is cached until its sessions change. Schedules of
+    upcoming sessions are also cached until the first session ends.
+
+    Args:
+        event (Event): Event to render schedule for.
+        upcoming_only (bool): True to only include sessions that
+            have not ended.
+
+    Returns:
+        Dictionary containing schedule HTML, list of dates of days in
+        the schedule, ETag of the HTML, and datetime the schedule of
+        upcoming sessions next changes (None if not known).
+    """
+    cache_key = SCHEDULE_CACHE_KEY.format(
+        event.pk,
+        'upcoming' if upcoming_only else 'all',
+        md5(repr(get_schedule_state(event)).encode()).hexdigest(),
+    )
+    schedule = cache.get(cache_key)
+    if schedule is None:
+        sessions = event.sessions.prefetch_related('locations')
+        if upcoming_only:
+            sessions = sessions.filter(end__gte=now())
+        sessions = list(sessions)
+        schedule_data = organise_schedule_data(sessions)
+        html = render_to_string('events/event_schedule.html', {'schedule': schedule_data})
+        schedule = {
+            'html': html,
+            'days': [day.date for day in schedule_data],
+            'etag': '"{}"'.format(md5(html.encode()).hexdigest()),
+            'next_change': None,
+        }
+        timeout = SCHEDULE_CACHE_TIMEOUT
+        if upcoming_only and sessions:
+            schedule['next_change'] = min(session.end for session in sessions)
+            timeout = max(min(timeout, (schedule['next_change'] - now()).total_seconds()), 1)
+        cache.set(cache_key, schedule, timeout)
+    return schedule
+
+
 def create_filter_helper(reset_url_pattern):
     """Return filter formatting helper.
 
@@ -138,3 +238,361 @@ def create_filter_helper(reset_url_pattern):
         )
     )
     return filter_formatter
+
+
+class MapArea():
+    """Class for an area of the map to find event locations within.
+
+    An area is either a circle (a point and radius), or a bounding box.
+    """
+
+    def __init__(self, point=None, radius=None, bbox=None):
+        """Create map area object.
+
+        Args:
+            point (Point): Centre of circle area.
+            radius (float): Radius of circle area in kilometres.
+            bbox (tuple): Bounds of box area as west, south, east,
+                and north coordinates.
+        """
+        self.point = point
+        self.radius = radius
+        self.bbox = bbox
+
+    def filter_event_locations(self, event_locations):
+        """Filter event location relationships to locations in area.
+
+        Circle areas are compared using geography values so distances
+        are in metres, and locations are ordered by distance.
+        Both area types use spatial indexes on location coordinates.
+
+        Args:
+            event_locations (QuerySet): Event location relationships.
+
+        Returns:
+            Filtered QuerySet.
+        """
+        if self.bbox:
+            west, south, east, north = self.bbox
+            if west <= east:
+                area_filter = Q(location__coords__within=Polygon.from_bbox((west, south, east, north)))
+            else:
+                # Box crosses the antimeridian
+                area_filter = (
+                    Q(location__coords__within=Polygon.from_bbox((west, south, 180, north))) |
+                    Q(location__coords__within=Polygon.from_bbox((-180, south, east, north)))
+                )
+            return event_locations.filter(area_filter)
+        return event_locations.annotate(
+            location_geography=Cast('location__coords', output_field=PointField(geography=True)),
+        ).filter(
+            location_geography__dwithin=(self.point, D(km=self.radius)),
+        ).annotate(
+            distance=Distance('location_geography', self.point),
+        ).order_by('distance', 'event__start', 'event__pk')
+
+
+def parse_map_area(parameters):
+    """Return map area from request parameters.
+
+    Circle areas are given by 'lat', 'lng', and 'radius' (kilometres)
+    parameters, and box areas by a 'bbox' parameter in the format
+    'west,south,east,north'.
+
+    Args:
+        parameters (QueryDict): Request query parameters.
+
+    Returns:
+        MapArea object, or None if no area is given.
+
+    Raises:
+        ValueError if parameters are invalid.
+    """
+    if parameters.get('bbox'):
+        bbox = tuple(float(value) for value in parameters['bbox'].split(','))
+        if len(bbox) != 4:
+            raise ValueError('Bounding box requires four coordinates.')
+        west, south, east, north = bbox
+        if not (-180 <= west <= 180 and -180 <= east <= 180 and -90 <= south <= north <= 90):
+            raise ValueError('Bounding box coordinates are out of range.')
+        return MapArea(bbox=bbox)
+    if parameters.get('lat') or parameters.get('lng'):
+        lat = float(parameters['lat'])
+        lng = float(parameters['lng'])
+        radius = float(parameters.get('radius', ''))
+        if not (-90 <= lat <= 90 and -180 <= lng <= 180 and 0 < radius <= MAP_AREA_MAX_RADIUS):
+            raise ValueError('Point or radius is out of range.')
+        return MapArea(point=Point(lng, lat, srid=4326), radius=radius)
+    return None
+
+
+def get_event_map_locations(area=None):
+    """Return map marker data for locations of upcoming events.
+
+    Event and location values are read in one query.
+
+    Args:
+        area (MapArea): Area to return locations within, ordered by
+            distance for circle areas. Defaults to all locations.
+
+    Returns:
+        List of dictionaries, one per location, containing coordinates,
+        title, and HTML text listing events at the location.
+    """
+    event_locations = get_upcoming_event_locations().order_by(
+        'event__start',
+        'event__pk',
+    )
+    if area:
+        event_locations = area.filter_event_locations(event_locations)
+    event_locations = event_locations.values_list(
+        'location__pk',
+        'location__name',
+        'location__coords',
+        'event__pk',
+        'event__slug',
+        'event__name',
+        'event__start',
+    )
+    map_locations = {}
+    for location_pk, location_name, coords, event_pk, event_slug, event_name, start in event_locations:
+        if location_pk not in map_locations:
+            # Create basic location information
+            map_locations[location_pk] = {
+                'coords': {'lat': coords.y, 'lng': coords.x},
+                'title': location_name,
+                'text': format_html('<div class="map-info-title">{}</div>', location_name),
+            }
+        map_locations[location_pk]['text'] += format_html(
+            '<p class="mb-0"><a href="{}">{} - {}</a></p>',
+            reverse('events:event', kwargs={'pk': event_pk, 'slug': event_slug}),
+            '{:%-d %b %Y}'.format(start),
+            event_name,
+        )
+    return list(map_locations.values())
+
+
+def update_event_location_summaries(event_pks):
+    """Update stored location summaries of events.
+
+    Locations of all events are read in one query, and all events are
+    updated in one query. Events are also marked as modified.
+
+    Args:
+        event_pks (iterable): Primary keys of events to update.
+    """
+    events = list(Event.objects.filter(pk__in=list(event_pks)).prefetch_related('locations'))
+    modified = now()
+    for event in events:
+        event.update_location_summary()
+        event.modified = modified
+    Event.objects.bulk_update(events, ['location_summary', 'location_count', 'modified'])
+
+
+def get_upcoming_event_locations():
+    """Return event location relationships of upcoming events.
+
+    Returns:
+        QuerySet of event location relationships.
+    """
+    return Event.locations.through.objects.filter(
+        event__published=True,
+        event__end__gte=now(),
+    )
+
+
+def get_event_map_clusters(area, zoom):
+    """Return clusters of locations of upcoming events within a map area.
+
+    Locations are grouped into grid cells sized for the zoom level, with
+    the grid computed in the database. Individual locations are returned
+    instead when zoomed in past the cluster zoom level.
+
+    Args:
+        area (MapArea): Area to return clusters within.
+        zoom (int): Zoom level of map.
+
+    Returns:
+        Dictionary containing a list of clusters, each with coordinates
+        and counts of locations and events, and a list of individual
+        location map marker data.
+    """
+    if zoom > MAP_CLUSTER_MAX_ZOOM:
+        return {'clusters': [], 'locations': get_event_map_locations(area)}
+    cell_size = 360 / (2 ** zoom * MAP_CLUSTER_CELLS_PER_TILE)
+    event_locations = area.filter_event_locations(get_upcoming_event_locations())
+    cells = event_locations.annotate(
+        cell=SnapToGrid('location__coords', cell_size),
+    ).order_by().values('cell').annotate(
+        centre=Centroid(Collect('location__coords')),
+        location_count=Count('location', distinct=True),
+        event_count=Count('event', distinct=True),
+    )
+    clusters = []
+    for cell in cells:
+        clusters.append({
+            'coords': {'lat': cell['centre'].y, 'lng': cell['centre'].x},
+            'location_count': cell['location_count'],
+            'event_count': cell['event_count'],
+        })
+    return {'clusters': clusters, 'locations': []}
+
+
+def get_calendar_start():
+    """Return start of today, the earliest end of events in calendars.
+
+    Returns:
+        Datetime of start of current day.
+    """
+    return localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def get_calendar_events(events):
+    """Return events shown in calendars.
+
+    Args:
+        events (QuerySet): Events to filter.
+
+    Returns:
+        QuerySet of published events ending from today.
+    """
+    return events.filter(
+        published=True,
+        start__isnull=False,
+        end__gte=get_calendar_start(),
+    )
+
+
+def get_calendar_validators(objects, modified=None):
+    """Return ETag and last modified datetime for a calendar.
+
+    Validators are read from the database rather than the cache, so
+    every server process gives the same validators for a calendar.
+    The number of objects changes when objects are removed, and the
+    latest modified datetime changes when objects or their locations
+    are changed.
+
+    Args:
+        objects (QuerySet): Events or sessions shown in calendar.
+        modified (datetime): Modified datetime of other calendar content.
+
+    Returns:
+        Tuple of ETag string and last modified datetime.
+    """
+    calendar_start = get_calendar_start()
+    state = objects.order_by().aggregate(
+        count=Count('pk', distinct=True),
+        modified=Max('modified'),
+        locations_modified=Max('locations__modified'),
+    )
+    last_modified = max(
+        value for value in (state['modified'], state['locations_modified'], modified, calendar_start) if value
+    )
+    etag = md5('{}-{}-{}'.format(
+        state['count'],
+        last_modified.isoformat(),
+        calendar_start.date().isoformat(),
+    ).encode()).hexdigest()
+    return '"{}"'.format(etag), last_modified
+
+
+def escape_ical_text(text):
+    """Escape text for an iCalendar property value.
+
+    Args:
+        text (str): Text to escape.
+
+    Returns:
+        Escaped text.
+    """
+    return text.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,').replace(
+        '\r\n', '\\n').replace('\n', '\\n')
+
+
+def format_ical_datetime(value):
+    """Format datetime as an iCalendar UTC datetime.
+
+    Args:
+        value (datetime): Datetime to format.
+
+    Returns:
+        Formatted datetime string.
+    """
+    return value.astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def fold_ical_line(line):
+    """Fold iCalendar content line to the maximum line length.
+
+    Args:
+        line (str): Content line.
+
+    Returns:
+        Content line with continuation lines, ending with a line break.
+    """
+    encoded = line.encode()
+    lines = []
+    while len(encoded) > ICAL_LINE_LENGTH:
+        # Avoid splitting a multi-byte character
+        split = ICAL_LINE_LENGTH if not lines else ICAL_LINE_LENGTH - 1
+        while encoded[split] & 0xC0 == 0x80:
+            split -= 1
+        lines.append(encoded[:split].decode())
+        encoded = encoded[split:]
+    lines.append(encoded.decode())
+    return '\r\n '.join(lines) + '\r\n'
+
+
+def create_ical_event(uid, timestamp, start, end, summary, description='', location='', url=''):
+    """Create iCalendar event component.
+
+    Args:
+        uid (str): Unique identifier of event.
+        timestamp (datetime): Datetime event information was created.
+        start (datetime): Start of event.
+        end (datetime): End of event.
+        summary (str): Name of event.
+        description (str): Description of event, may contain HTML.
+        location (str): Location of event.
+        url (str): URL of event.
+
+    Returns:
+        String of event component.
+    """
+    properties = [
+        ('BEGIN', 'VEVENT'),
+        ('UID', uid),
+        ('DTSTAMP', format_ical_datetime(timestamp)),
+        ('DTSTART', format_ical_datetime(start)),
+        ('DTEND', format_ical_datetime(end)),
+        ('SUMMARY', escape_ical_text(summary)),
+    ]
+    if description:
+        properties.append(('DESCRIPTION', escape_ical_text(strip_tags(description).strip())))
+    if location:
+        properties.append(('LOCATION', escape_ical_text(location)))
+    if url:
+        properties.append(('URL', url))
+    properties.append(('END', 'VEVENT'))
+    return ''.join(fold_ical_line('{}:{}'.format(name, value)) for name, value in properties)
+
+
+def stream_ical_calendar(name, events):
+    """Yield iCalendar calendar in parts, for streaming responses.
+
+    Args:
+        name (str): Name of calendar.
+        events (iterable): Strings of event components.
+
+    Yields:
+        Strings of calendar content.
+    """
+    yield ''.join([
+        fold_ical_line('BEGIN:VCALENDAR'),
+        fold_ical_line('VERSION:2.0'),
+        fold_ical_line('PRODID:' + ICAL_PRODUCT_ID),
+        fold_ical_line('CALSCALE:GREGORIAN'),
+        fold_ical_line('X-WR-CALNAME:' + escape_ical_text(name)),
+    ])
+    yield from events
+    yield fold_ical_line('END:VCALENDAR')
@@ -1,15 +1,40 @@
 """Views for events application."""
 
+from django.http import JsonResponse, StreamingHttpResponse, Http404
+from django.shortcuts import get_object_or_404
 from django.views import generic
-from django.utils.timezone import now
+from django.views.decorators.http import require_http_methods
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from django_filters.views import FilterView
-from utils.mixins import RedirectToCosmeticURLMixin
+from utils.mixins import RedirectToCosmeticURLMixin, KeysetPaginationMixin
+from users.models import Entity
 from events.models import (
     Event,
     Location,
+    Series,
 )
-from events.filters import UpcomingEventFilter, PastEventFilter
-from events.utils import create_filter_helper, organise_schedule_data
+from events.filters import (
+    UpcomingEventFilter,
+    PastEventFilter,
+    filter_by_region,
+    filter_by_organiser,
+)
+from events.utils import (
+    create_filter_helper,
+    get_event_schedule,
+    get_event_map_locations,
+    parse_map_area,
+    get_event_map_clusters,
+    MAP_MAX_ZOOM,
+    get_calendar_events,
+    get_calendar_validators,
+    create_ical_event,
+    stream_ical_calendar,
+)
+
+ICAL_CONTENT_TYPE = 'text/calendar; charset=utf-8'
+ICAL_ITERATOR_CHUNK_SIZE = 100
 
 
 class HomeView(generic.TemplateView):
@@ -17,44 +42,42 @@ class HomeView(generic.TemplateView):
 
     template_name = 'events/home.html'
 
-    def get_context_data(self, **kwargs):
-        """Provide the context data for the event homepage view.
 
-        Returns:
-            Dictionary of context data.
-        """
-        context = super().get_context_data(**kwargs)
-        future_events = Event.objects.filter(published=True).filter(end__gte=now()).order_by('start').prefetch_related(
-            'organisers',
-            'locations',
-            'sponsors',
-        ).select_related(
-            'series',
-        )
-        raw_map_locations = {}
-        for event in future_events:
-            for location in event.locations.all():
-                key = location.pk
-                if location.pk not in raw_map_locations:
-                    # Create basic location information
-                    raw_map_locations[key] = {
-                        'coords': {'lat': location.coords.y, 'lng': location.coords.x},
-                        'title': location.name,
-                        'text': '<div class="map-info-title">{}</div>'.format(location.name),
-                    }
-                raw_map_locations[key]['text'] += '<p class="mb-0"><a href="{}">{:%-d %b %Y} - {}</a></p>'.format(
-                    event.get_absolute_url(),
-                    event.start,
-                    event.name
-                )
-        context['raw_map_locations'] = list(raw_map_locations.values())
-        return context
+@require_http_methods(["GET"])
+def event_map_locations_json(request):
+    """Return JSON containing map markers for locations of upcoming events.
 
+    Locations can be limited to a map area, see parse_map_area
+    for parameters.
+    """
+    try:
+        area = parse_map_area(request.GET)
+    except ValueError as error:
+        return JsonResponse({'error': str(error)}, status=400)
+    return JsonResponse({'locations': get_event_map_locations(area)})
 
-class EventUpcomingView(FilterView):
+
+@require_http_methods(["GET"])
+def event_map_clusters_json(request):
+    """Return JSON containing clusters of locations of upcoming events.
+
+    Requires a map area (see parse_map_area for parameters) and a
+    'zoom' parameter of the map zoom level.
+    """
+    try:
+        area = parse_map_area(request.GET)
+        zoom = int(request.GET.get('zoom', ''))
+        if area is None or not 0 <= zoom <= MAP_MAX_ZOOM:
+            raise ValueError('Map area and zoom level are required.')
+    except ValueError as error:
+        return JsonResponse({'error': str(error)}, status=400)
+    return JsonResponse(get_event_map_clusters(area, zoom))
+
+
+class EventUpcomingView(KeysetPaginationMixin, FilterView):
     """View for listing upcoming events."""
 
-    # TODO: Add pagination
+    keyset_ordering = ('start', 'pk')
     filterset_class = UpcomingEventFilter
     context_object_name = 'events'
     template_name = 'events/upcoming_events.html'
@@ -70,10 +93,10 @@ class EventUpcomingView(FilterView):
         return context
 
 
-class EventPastView(FilterView):
+class EventPastView(KeysetPaginationMixin, FilterView):
     """View for listing past events."""
 
-    # TODO: Add pagination
+    keyset_ordering = ('-end', '-pk')
     filterset_class = PastEventFilter
     context_object_name = 'events'
     template_name = 'events/past_events.html'
@@ -112,9 +135,9 @@ class EventDetailView(RedirectToCosmeticURLMixin, generic.DetailView):
         context = super().get_context_data(**kwargs)
         context['sponsors'] = self.object.sponsors.all()
         context['organisers'] = self.object.organisers.all()
-        context['schedule'] = organise_schedule_data(
-            self.object.sessions.all().prefetch_related('locations')
-        )
+        schedule = get_event_schedule(self.object)
+        context['schedule_html'] = schedule['html']
+        context['schedule_days'] = schedule['days']
         context['locations'] = self.object.locations.all()
         return context
 
@@ -124,3 +147,123 @@ class LocationDetailView(RedirectToCosmeticURLMixin, generic.DetailView):
 
     model = Location
     context_object_name = 'location'
+
+
+def create_calendar_response(request, name, objects, ical_events, modified=None):
+    """Return streaming response of iCalendar calendar.
+
+    A 304 response is returned if the calendar has not changed since
+    the version given in the request.
+
+    Args:
+        request (HttpRequest): Request for calendar.
+        name (str): Name of calendar.
+        objects (QuerySet): Events or sessions shown in calendar.
+        ical_events (function): Generator function of iCalendar events,
+            given the last modified datetime of the calendar.
+        modified (datetime): Modified datetime of other calendar content.
+
+    Returns:
+        StreamingHttpResponse of calendar.
+    """
+    etag, last_modified = get_calendar_validators(objects, modified)
+    response = get_conditional_response(request, etag=etag, last_modified=int(last_modified.timestamp()))
+    if response is None:
+        response = StreamingHttpResponse(
+            stream_ical_calendar(name, ical_events(last_modified)),
+            content_type=ICAL_CONTENT_TYPE,
+        )
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified.timestamp())
+    return response
+
+
+def create_events_calendar_response(request, name, events):
+    """Return streaming response of iCalendar calendar of events.
+
+    Events are read from the database in chunks while streaming.
+
+    Args:
+        request (HttpRequest): Request for calendar.
+        name (str): Name of calendar.
+        events (QuerySet): Events to include, before filtering by date.
+
+    Returns:
+        StreamingHttpResponse of calendar.
+    """
+    events = get_calendar_events(events)
+
+    def ical_events(timestamp):
+        for event in events.order_by('start', 'pk').prefetch_related('locations').iterator(
+            chunk_size=ICAL_ITERATOR_CHUNK_SIZE,
+        ):
+            locations = event.locations.all()
+            yield create_ical_event(
+                uid='event-{}@{}'.format(event.pk, request.get_host()),
+                timestamp=timestamp,
+                start=event.start,
+                end=event.end,
+                summary=event.name,
+                description=event.description,
+                location='; '.join(location.get_full_address().replace(',\n', ', ') for location in locations),
+                url=request.build_absolute_uri(event.get_absolute_url()),
+            )
+
+    return create_calendar_response(request, name, events, ical_events)
+
+
+@require_http_methods(["GET"])
+def events_calendar(request):
+    """Return iCalendar calendar of upcoming events."""
+    return create_events_calendar_response(request, 'Events', Event.objects.all())
+
+
+@require_http_methods(["GET"])
+def series_events_calendar(request, pk):
+    """Return iCalendar calendar of upcoming events in a series."""
+    series = get_object_or_404(Series, pk=pk)
+    return create_events_calendar_response(request, '{} events'.format(series.name), series.events.all())
+
+
+@require_http_methods(["GET"])
+def region_events_calendar(request, region):
+    """Return iCalendar calendar of upcoming events in a region."""
+    region_name = dict(Location.REGION_CHOICES).get(region)
+    if region_name is None:
+        raise Http404('Region not found.')
+    events = filter_by_region(Event.objects.all(), 'locations__region', region)
+    return create_events_calendar_response(request, 'Events in {}'.format(region_name), events)
+
+
+@require_http_methods(["GET"])
+def organiser_events_calendar(request, pk):
+    """Return iCalendar calendar of upcoming events by an organiser."""
+    organiser = get_object_or_404(Entity, pk=pk)
+    events = filter_by_organiser(Event.objects.all(), 'organisers', organiser)
+    return create_events_calendar_response(request, 'Events by {}'.format(organiser.name), events)
+
+
+@require_http_methods(["GET"])
+def event_sessions_calendar(request, pk):
+    """Return iCalendar calendar of sessions of an event."""
+    event = get_object_or_404(Event, pk=pk, published=True, show_schedule=True)
+    sessions = event.sessions.all()
+    event_url = request.build_absolute_uri(event.get_absolute_url())
+
+    def ical_events(timestamp):
+        for session in sessions.order_by('start', 'end', 'pk').prefetch_related('locations').iterator(
+            chunk_size=ICAL_ITERATOR_CHUNK_SIZE,
+        ):
+            locations = session.locations.all()
+            yield create_ical_event(
+                uid='session-{}@{}'.format(session.pk, request.get_host()),
+                timestamp=timestamp,
+                start=session.start,
+                end=session.end,
+                summary=session.name,
+                description=session.description,
+                location='; '.join(location.get_full_address().replace(',\n', ', ') for location in locations),
+                url=session.url or event_url,
+            )
+
+    return create_calendar_response(request, event.name, sessions, ical_events, modified=event.modified)
@@ -1,9 +1,25 @@
 """Module for the custom Django rebuild_search_indexes command."""
 
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
 from django.core import management
-from django.db import transaction
+from django.db import connections
+from django.db.models import Min, Max
 from resources.models import Resource
-from utils.search_utils import get_search_index_updater
+from utils.search_utils import update_search_index_range
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+def rebuild_resource_search_index_range(start_pk, end_pk, changed_only):
+    """Rebuild search indexes of resources within a primary key range.
+
+    Defined at module level so it can be run by worker processes.
+
+    Returns:
+        Number of resources updated.
+    """
+    return update_search_index_range(Resource, start_pk, end_pk, changed_only)
 
 
 class Command(management.base.BaseCommand):
@@ -11,7 +27,54 @@ class Command(management.base.BaseCommand):
 
     help = "Rebuild search indexes in database."
 
+    def add_arguments(self, parser):
+        """Add arguments for the command."""
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help='Number of primary keys in each range updated by one query.',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of worker processes to rebuild chunks in parallel.',
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Write all rows, including rows where the search index is unchanged.',
+        )
+
     def handle(self, *args, **options):
         """Automatically called when the command is given."""
-        for resource in Resource.objects.all():
-            transaction.on_commit(get_search_index_updater(resource))
+        chunk_size = max(options['chunk_size'], 1)
+        changed_only = not options['all']
+        pk_range = Resource.objects.aggregate(start=Min('pk'), end=Max('pk'))
+        if pk_range['start'] is None:
+            print('No resources to index.')
+            return
+        chunks = [
+            (start_pk, start_pk + chunk_size, changed_only)
+            for start_pk in range(pk_range['start'], pk_range['end'] + 1, chunk_size)
+        ]
+
+        start_time = perf_counter()
+        if options['workers'] > 1:
+            # Connections cannot be shared with forked worker processes.
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=options['workers']) as executor:
+                results = list(executor.map(rebuild_resource_search_index_range, *zip(*chunks)))
+        else:
+            results = [rebuild_resource_search_index_range(*chunk) for chunk in chunks]
+        duration = perf_counter() - start_time
+
+        resource_count = Resource.objects.count()
+        print('Rebuilt search indexes for {} of {} resources ({} chunks) in {:.2f}s ({:.0f} resources/s).'.format(
+            sum(results),
+            resource_count,
+            len(chunks),
+            duration,
+            resource_count / duration if duration else resource_count,
+        ))
@@ -32,8 +32,14 @@ class POChoiceField(forms.ModelChoiceField):
     - Field widget is custom HTML table.
     """
 
-    def __init__(self, resource, *args, **kwargs):
-        """Initialise method."""
+    def __init__(self, resource, progress_outcome_catalogue, *args, **kwargs):
+        """Initialise method.
+
+        Args:
+            resource (Resource): Resource the choice is made for.
+            progress_outcome_catalogue (ProgressOutcomeCatalogue): Catalogue
+                shared by all fields of the form, to read choices from.
+        """
         super().__init__(
             queryset=ProgressOutcome.objects.order_by('code'),
             to_field_name='code',
@@ -43,6 +49,8 @@ class POChoiceField(forms.ModelChoiceField):
             widget=ProgressOutcomeTableRadioSelect(),
             label='Choose ONE progress outcome or option that applies BEST to this resource:'
         )
+        # Choices from catalogue avoid a query each time the field is rendered
+        self.choices = progress_outcome_catalogue.choices
         # Used for summary calculations
         self.resource = resource
 
@@ -8,13 +8,16 @@ from poet.models import (
     Resource,
     ProgressOutcome,
     ProgressOutcomeGroup,
-    Submission,
 )
 from poet.fields import (
     ResourceField,
     POChoiceField,
     FeedbackField,
 )
+from poet.utils import (
+    get_submission_counts,
+    get_progress_outcome_catalogue,
+)
 from poet import settings as poet_settings
 from crispy_forms.helper import FormHelper
 from crispy_forms.layout import Layout, Submit
@@ -53,92 +56,121 @@ class POETSurveySelectorForm(forms.Form):
 class POETSurveyForm(forms.Form):
     """Form for resource displayed in form."""
 
+    def __init__(self, *args, **kwargs):
+        """Get progress outcome catalogue once for all fields of form."""
+        super().__init__(*args, **kwargs)
+        self.progress_outcome_catalogue = get_progress_outcome_catalogue()
+
     def add_fields_from_resources(self, resources):
         """Add fields to form from list of resources."""
         for i, resource in enumerate(resources):
             self.fields['resource' + str(i)] = ResourceField(resource, i + 1)
-            self.fields['choice' + str(i)] = POChoiceField(resource)
+            self.fields['choice' + str(i)] = POChoiceField(resource, self.progress_outcome_catalogue)
             self.fields['feedback' + str(i)] = FeedbackField()
 
+    def get_request_data(self, request):
+        """Get survey answers from POST data of request.
+
+        Resources and progress outcomes of all answers are fetched
+        with one query each, and the answers are stored on the form
+        so they are only read once per request.
+
+        Returns:
+            List of dictionaries with resource, progress outcome code,
+            progress outcome (None if no choice made), and feedback.
+
+        Raises:
+            ObjectDoesNotExist if a resource or progress outcome does not exist.
+        """
+        if hasattr(self, 'request_data'):
+            return self.request_data
+        data = []
+        i = 0
+        run_loop = True
+        while run_loop:
+            data.append({
+                'resource_pk': int(request.POST['resource' + str(i)]),
+                'progress_outcome_code': request.POST.get('choice' + str(i), None),
+                'feedback': request.POST.get('feedback' + str(i), ''),
+            })
+            if request.POST.get('resource' + str(i + 1), False):
+                i += 1
+            else:
+                run_loop = False
+
+        resources = Resource.objects.in_bulk([row['resource_pk'] for row in data])
+        progress_outcomes = {
+            progress_outcome.code: progress_outcome
+            for progress_outcome in ProgressOutcome.objects.filter(
+                code__in=[row['progress_outcome_code'] for row in data if row['progress_outcome_code']],
+            )
+        }
+        for row in data:
+            # Check data exists
+            try:
+                row['resource'] = resources[row['resource_pk']]
+            except KeyError:
+                raise Resource.DoesNotExist('Resource {} does not exist'.format(row['resource_pk']))
+            progress_outcome_code = row['progress_outcome_code']
+            if progress_outcome_code and progress_outcome_code not in progress_outcomes:
+                raise ProgressOutcome.DoesNotExist('Progress outcome {} does not exist'.format(progress_outcome_code))
+            row['progress_outcome'] = progress_outcomes.get(progress_outcome_code)
+        self.request_data = data
+        return data
+
     def add_fields_from_request(self, request):
         """Add fields to form from request object."""
         resource_session_pks = request.session.get('poet_form_resources', list())
         if not resource_session_pks:
             raise forms.ValidationError('Resouce IDs not present in session')
-        i = 0
-        run_loop = True
-        while run_loop:
-            resource_pk = int(request.POST['resource' + str(i)])
-            if resource_pk != resource_session_pks[i]:
+        for i, row in enumerate(self.get_request_data(request)):
+            if row['resource_pk'] != resource_session_pks[i]:
                 forms.ValidationError('Resource IDs from form do not match session data')
-            progress_outcome_code = request.POST.get('choice' + str(i), None)
-            feedback = request.POST.get('feedback' + str(i), '')
-            # Check data exists
-            resource = Resource.objects.get(pk=resource_pk)
-            if progress_outcome_code:
-                ProgressOutcome.objects.get(code=progress_outcome_code)
             # Create fields
             self.fields['resource' + str(i)] = ResourceField(
-                resource,
+                row['resource'],
                 i + 1,
             )
             self.fields['choice' + str(i)] = POChoiceField(
-                resource,
-                initial=progress_outcome_code,
+                row['resource'],
+                self.progress_outcome_catalogue,
+                initial=row['progress_outcome_code'],
             )
             self.fields['feedback' + str(i)] = FeedbackField(
-                initial=feedback,
+                initial=row['feedback'],
             )
-            if request.POST.get('resource' + str(i + 1), False):
-                i += 1
-            else:
-                run_loop = False
 
     def validate(self, request):
         """Validate the form contains required information."""
         data = []
-        i = 0
-        run_loop = True
-        while run_loop:
-            resource_pk = int(request.POST['resource' + str(i)])
-            progress_outcome_code = request.POST.get('choice' + str(i), None)
-            feedback = request.POST.get('feedback' + str(i), '')
-
-            if not progress_outcome_code:
+        for row in self.get_request_data(request):
+            if not row['progress_outcome']:
                 raise forms.ValidationError(
                     'A progress outcome choice is blank, please fill in one option for each table'
                 )
-
-            resource = Resource.objects.get(pk=resource_pk)
-            progress_outcome = ProgressOutcome.objects.get(code=progress_outcome_code)
-
             data.append({
-                'resource': resource,
-                'progress_outcome': progress_outcome,
-                'feedback': feedback,
+                'resource': row['resource'],
+                'progress_outcome': row['progress_outcome'],
+                'feedback': row['feedback'],
             })
-
-            if request.POST.get('resource' + str(i + 1), False):
-                i += 1
-            else:
-                run_loop = False
         return data
 
     def update_form_with_summary(self):
         """Update each choice option with percentage selected."""
+        submission_counts = get_submission_counts(
+            field.resource for field_id, field in self.fields.items() if field_id.startswith('choice')
+        )
         for field_id, field in list(self.fields.items()):
             field.disabled = True
             if field_id.startswith('choice'):
-                resource = field.resource
-                total_submissions = Submission.objects.filter(resource=resource).count()
+                resource_submission_counts = submission_counts[field.resource.pk]
+                total_submissions = sum(resource_submission_counts.values())
                 if total_submissions < poet_settings.MINIMUM_SUBMISSIONS_PER_RESOURCE:
                     field.widget.incomplete_data = True
                 else:
-                    count_data = ProgressOutcome.objects.filter(submissions__resource=resource).values(
-                        'code').annotate(count=Count('submissions'))
                     percentage_data = dict()
-                    for data in count_data:
-                        percentage_data[data['code']] = (data['count'] / total_submissions)
+                    for code, count in resource_submission_counts.items():
+                        percentage_data[code] = (count / total_submissions)
                     field.widget.percentage_data = percentage_data
                     field.widget.percentage_matching = percentage_data[field.initial] * 100
                 field.label = ''
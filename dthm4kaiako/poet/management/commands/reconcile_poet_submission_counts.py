@@ -0,0 +1,51 @@
+"""Module for the custom Django reconcile_poet_submission_counts command."""
+
+from django.core import management
+from django.db import connection, transaction
+from django.db.models import Count
+from poet.models import Submission, SubmissionCount
+
+
+class Command(management.base.BaseCommand):
+    """Required command class for the custom Django reconcile_poet_submission_counts command."""
+
+    help = "Check POET submission counts against submissions and correct any differences."
+
+    def handle(self, *args, **options):
+        """Automatically called when the reconcile_poet_submission_counts command is given."""
+        with transaction.atomic():
+            # Block submission writes while counting, so the counts
+            # compared are from the same set of submissions.
+            with connection.cursor() as cursor:
+                cursor.execute('LOCK TABLE {} IN SHARE MODE'.format(Submission._meta.db_table))
+            expected_counts = {
+                (resource_pk, progress_outcome_pk): count
+                for resource_pk, progress_outcome_pk, count in Submission.objects.order_by().values_list(
+                    'resource', 'progress_outcome',
+                ).annotate(count=Count('pk'))
+            }
+            created = []
+            updated = []
+            deleted_pks = []
+            for submission_count in SubmissionCount.objects.all():
+                key = (submission_count.resource_id, submission_count.progress_outcome_id)
+                expected_count = expected_counts.pop(key, None)
+                if expected_count is None:
+                    deleted_pks.append(submission_count.pk)
+                elif submission_count.count != expected_count:
+                    submission_count.count = expected_count
+                    updated.append(submission_count)
+            for (resource_pk, progress_outcome_pk), count in expected_counts.items():
+                created.append(SubmissionCount(
+                    resource_id=resource_pk,
+                    progress_outcome_id=progress_outcome_pk,
+                    count=count,
+                ))
+            SubmissionCount.objects.filter(pk__in=deleted_pks).delete()
+            SubmissionCount.objects.bulk_update(updated, ['count'])
+            SubmissionCount.objects.bulk_create(created)
+        print('POET submission counts reconciled ({} created, {} updated, {} deleted).'.format(
+            len(created),
+            len(updated),
+            len(deleted_pks),
+        ))
@@ -0,0 +1,88 @@
+# Generated by Django 4.2.13 on 2026-10-18 16:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# Statement level triggers keep submission counts up to date, including
+# bulk writes that do not send signals.
+CREATE_TRIGGERS_SQL = '''
+CREATE FUNCTION poet_submission_count_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE poet_submissioncount SET "count" = poet_submissioncount."count" - removed."count"
+        FROM (
+            SELECT resource_id, progress_outcome_id, COUNT(*) AS "count"
+            FROM old_submissions GROUP BY resource_id, progress_outcome_id
+        ) removed
+        WHERE poet_submissioncount.resource_id = removed.resource_id
+            AND poet_submissioncount.progress_outcome_id = removed.progress_outcome_id;
+        DELETE FROM poet_submissioncount
+        USING (SELECT DISTINCT resource_id, progress_outcome_id FROM old_submissions) removed
+        WHERE poet_submissioncount.resource_id = removed.resource_id
+            AND poet_submissioncount.progress_outcome_id = removed.progress_outcome_id
+            AND poet_submissioncount."count" = 0;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO poet_submissioncount (resource_id, progress_outcome_id, "count")
+        SELECT resource_id, progress_outcome_id, COUNT(*)
+        FROM new_submissions GROUP BY resource_id, progress_outcome_id
+        ON CONFLICT (resource_id, progress_outcome_id)
+        DO UPDATE SET "count" = poet_submissioncount."count" + EXCLUDED."count";
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER poet_submission_insert_count
+    AFTER INSERT ON poet_submission
+    REFERENCING NEW TABLE AS new_submissions
+    FOR EACH STATEMENT EXECUTE FUNCTION poet_submission_count_trigger();
+
+CREATE TRIGGER poet_submission_update_count
+    AFTER UPDATE ON poet_submission
+    REFERENCING OLD TABLE AS old_submissions NEW TABLE AS new_submissions
+    FOR EACH STATEMENT EXECUTE FUNCTION poet_submission_count_trigger();
+
+CREATE TRIGGER poet_submission_delete_count
+    AFTER DELETE ON poet_submission
+    REFERENCING OLD TABLE AS old_submissions
+    FOR EACH STATEMENT EXECUTE FUNCTION poet_submission_count_trigger();
+'''
+
+DROP_TRIGGERS_SQL = '''
+DROP TRIGGER poet_submission_insert_count ON poet_submission;
+DROP TRIGGER poet_submission_update_count ON poet_submission;
+DROP TRIGGER poet_submission_delete_count ON poet_submission;
+DROP FUNCTION poet_submission_count_trigger();
+'''
+
+POPULATE_COUNTS_SQL = '''
+INSERT INTO poet_submissioncount (resource_id, progress_outcome_id, "count")
+SELECT resource_id, progress_outcome_id, COUNT(*)
+FROM poet_submission GROUP BY resource_id, progress_outcome_id;
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('poet', '0007_auto_20220406_1005'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubmissionCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('progress_outcome', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='submission_counts', to='poet.progressoutcome')),
+                ('resource', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='submission_counts', to='poet.resource')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='submissioncount',
+            constraint=models.UniqueConstraint(fields=('resource', 'progress_outcome'), name='poet_submission_count_unique'),
+        ),
+        migrations.RunSQL(CREATE_TRIGGERS_SQL, DROP_TRIGGERS_SQL),
+        migrations.RunSQL(POPULATE_COUNTS_SQL, migrations.RunSQL.noop),
+    ]
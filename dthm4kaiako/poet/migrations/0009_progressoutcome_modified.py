@@ -0,0 +1,18 @@
+# Generated by Django 4.2.13 on 2026-10-19 10:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('poet', '0008_submissioncount'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='progressoutcome',
+            name='modified',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
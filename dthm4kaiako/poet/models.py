@@ -17,6 +17,7 @@ class ProgressOutcome(models.Model):
     technological_area = models.CharField(max_length=100)
     technological_area_code = models.CharField(max_length=10)
     content = models.TextField()
+    modified = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         """Text representation of object.
@@ -102,3 +103,42 @@ class Submission(models.Model):
         on_delete=models.CASCADE,
         related_name='submissions',
     )
+
+
+class SubmissionCount(models.Model):
+    """Model for number of submissions of a progress outcome for a resource.
+
+    Counts are maintained by database triggers whenever submissions
+    are written (see migration 0008), and can be rebuilt with the
+    reconcile_poet_submission_counts command.
+    """
+
+    resource = models.ForeignKey(
+        Resource,
+        on_delete=models.CASCADE,
+        related_name='submission_counts',
+    )
+    progress_outcome = models.ForeignKey(
+        ProgressOutcome,
+        on_delete=models.CASCADE,
+        related_name='submission_counts',
+    )
+    count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        """Text representation of object.
+
+        Returns:
+            Resource, progress outcome, and count (str).
+        """
+        return '{} - {}: {}'.format(self.resource, self.progress_outcome, self.count)
+
+    class Meta:
+        """Meta options for class."""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=['resource', 'progress_outcome'],
+                name='poet_submission_count_unique',
+            ),
+        ]
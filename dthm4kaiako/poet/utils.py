@@ -1,21 +1,150 @@
 """Utilithy functions for POET application."""
 
-import random
-from poet.models import Resource
-from poet.settings import NUM_RESOURCES_PER_FORM
+from json import dumps
+from operator import attrgetter
+from django.db.models import Case, Count, F, Max, Sum, Value, When, Window
+from django.db.models.functions import Coalesce, RowNumber
+from poet.models import ProgressOutcome, Resource, SubmissionCount
+from poet.settings import NUM_RESOURCES_PER_FORM, MINIMUM_SUBMISSIONS_PER_RESOURCE
+
+CROWDSOURCED_PROGRESS_OUTCOMES_PER_RESOURCE = 3
+_progress_outcome_catalogue = None
 
 
 def select_resources_for_poet_form(progress_outcome_group):
     """Select resources for POET form based off user request.
 
+    Resources are sampled randomly by the database, with resources
+    below the minimum number of submissions chosen first so they
+    reach enough submissions for statistics sooner.
+
     Args:
         progress_outcome_group (ProgressOutcomeGroup): Group selected by user in form.
 
     Returns:
         List of resource pks.
     """
-    all_resources = Resource.objects.filter(
+    resources = Resource.objects.filter(
         active=True,
         target_progress_outcome__in=progress_outcome_group.progress_outcomes.all(),
-    ).values_list('pk', flat=True)
-    return sorted(random.sample(list(all_resources), NUM_RESOURCES_PER_FORM))
+    ).annotate(
+        submission_count=Coalesce(Sum('submission_counts__count'), 0),
+        has_minimum_submissions=Case(
+            When(submission_count__lt=MINIMUM_SUBMISSIONS_PER_RESOURCE, then=Value(False)),
+            default=Value(True),
+        ),
+    ).order_by('has_minimum_submissions', '?').values_list('pk', flat=True)
+    return sorted(resources[:NUM_RESOURCES_PER_FORM])
+
+
+def get_crowdsourced_progress_outcomes(limit=CROWDSOURCED_PROGRESS_OUTCOMES_PER_RESOURCE):
+    """Get most submitted progress outcomes of every resource in one query.
+
+    Submission counts are ranked within each resource with ROW_NUMBER()
+    so only the top progress outcomes are returned by the database.
+
+    Args:
+        limit (int): Number of progress outcomes per resource.
+
+    Returns:
+        Dictionary of resource primary keys to lists of progress outcomes,
+        ordered by descending submission count. Each progress outcome has
+        a submission_count attribute.
+    """
+    submission_count = F('submission_counts__count')
+    progress_outcomes = ProgressOutcome.objects.annotate(
+        resource_pk=F('submission_counts__resource'),
+        submission_count=submission_count,
+        rank=Window(
+            RowNumber(),
+            partition_by=F('submission_counts__resource'),
+            order_by=[submission_count.desc(), F('label').asc(), F('pk').asc()],
+        ),
+    ).filter(
+        resource_pk__isnull=False,
+        rank__lte=limit,
+    ).order_by('resource_pk', 'rank')
+    crowdsourced_progress_outcomes = dict()
+    for progress_outcome in progress_outcomes:
+        crowdsourced_progress_outcomes.setdefault(progress_outcome.resource_pk, []).append(progress_outcome)
+    return crowdsourced_progress_outcomes
+
+
+def get_submission_counts(resources):
+    """Get submission counts of progress outcomes for resources.
+
+    Args:
+        resources (iterable): Resources to get counts for.
+
+    Returns:
+        Dictionary of resource primary keys to dictionaries of
+        progress outcome codes to submission counts.
+    """
+    submission_counts = {resource.pk: dict() for resource in resources}
+    for resource_pk, progress_outcome_code, count in SubmissionCount.objects.filter(
+        resource__in=submission_counts.keys(),
+    ).values_list('resource', 'progress_outcome__code', 'count'):
+        submission_counts[resource_pk][progress_outcome_code] = count
+    return submission_counts
+
+
+class ProgressOutcomeCatalogue:
+    """All progress outcomes with the values POET forms derive from them.
+
+    Catalogues are shared between requests, so their progress
+    outcomes must not be modified.
+    """
+
+    def __init__(self, state):
+        """Load progress outcomes from the database.
+
+        Args:
+            state (tuple): State of progress outcomes when loaded,
+                from get_progress_outcome_state.
+        """
+        self.state = state
+        self.progress_outcomes = list(ProgressOutcome.objects.all())
+        self.learning_area_progress_outcomes = [
+            progress_outcome for progress_outcome in self.progress_outcomes if progress_outcome.learning_area
+        ]
+        self.choices = [
+            (progress_outcome.code, progress_outcome.short_label)
+            for progress_outcome in sorted(self.progress_outcomes, key=attrgetter('code'))
+        ]
+        fields = [field for field in ProgressOutcome._meta.concrete_fields if field.name != 'modified']
+        self.json = dumps([
+            {field.attname: getattr(progress_outcome, field.attname) for field in fields}
+            for progress_outcome in self.progress_outcomes
+        ])
+
+
+def get_progress_outcome_state():
+    """Return state of stored progress outcomes.
+
+    The state changes whenever a progress outcome is created, saved,
+    or deleted. It is read from the database, so changes made by other
+    processes (for example the load_poet_data command) are seen.
+
+    Returns:
+        Tuple of number of progress outcomes and latest modified datetime.
+    """
+    state = ProgressOutcome.objects.order_by().aggregate(count=Count('pk'), modified=Max('modified'))
+    return (state['count'], state['modified'])
+
+
+def get_progress_outcome_catalogue():
+    """Get catalogue of progress outcomes, loading it if changed.
+
+    The catalogue is kept in memory for the process, and reloaded
+    when the state of stored progress outcomes changes.
+
+    Returns:
+        ProgressOutcomeCatalogue object.
+    """
+    global _progress_outcome_catalogue
+    state = get_progress_outcome_state()
+    catalogue = _progress_outcome_catalogue
+    if catalogue is None or catalogue.state != state:
+        catalogue = ProgressOutcomeCatalogue(state)
+        _progress_outcome_catalogue = catalogue
+    return catalogue
@@ -1,13 +1,13 @@
 """Views for POET application."""
 
 from ipware import get_client_ip
-from json import dumps
 from django.forms import ValidationError
 from django.urls import reverse, reverse_lazy
 from django.shortcuts import render, redirect
 from django.core.exceptions import ObjectDoesNotExist
 from django.contrib import messages
-from django.db.models import Q, Count
+from django.db.models import Q, Sum
+from django.db.models.functions import Coalesce
 from django.contrib.auth.mixins import PermissionRequiredMixin
 from django.views.generic import (
     ListView,
@@ -25,7 +25,10 @@ from poet.models import (
     ProgressOutcome,
     Resource,
 )
-from poet.utils import select_resources_for_poet_form
+from poet.utils import (
+    select_resources_for_poet_form,
+    get_crowdsourced_progress_outcomes,
+)
 from poet import settings as poet_settings
 
 
@@ -84,9 +87,9 @@ def poet_form(request):
         else:
             # Save submissions to database
             client_ip, is_routable = get_client_ip(request)
-            for submission_data in data:
-                submission_data['ip_address'] = client_ip
-                Submission.objects.create(**submission_data)
+            Submission.objects.bulk_create([
+                Submission(ip_address=client_ip, **submission_data) for submission_data in data
+            ])
             # Delete session data
             request.session.pop('poet_form_resources', None)
             request.session.pop('poet_form_active', None)
@@ -110,8 +113,9 @@ def poet_form(request):
         form = POETSurveyForm()
         form.add_fields_from_resources(resources)
         context['form'] = form
-    context['progress_outcomes'] = ProgressOutcome.objects.exclude(learning_area__exact='')
-    context['progress_outcomes_json'] = dumps(list(ProgressOutcome.objects.values()))
+    progress_outcome_catalogue = form.progress_outcome_catalogue
+    context['progress_outcomes'] = progress_outcome_catalogue.learning_area_progress_outcomes
+    context['progress_outcomes_json'] = progress_outcome_catalogue.json
     return render(request, template, context)
 
 
@@ -132,8 +136,9 @@ class StatisticsListView(PermissionRequiredMixin, ListView):
         return Resource.objects.all().order_by(
             'target_progress_outcome',
             'title',
-        ).annotate(submission_count=Count('submissions')).prefetch_related(
-            'submissions',
+        ).annotate(
+            submission_count=Coalesce(Sum('submission_counts__count'), 0),
+        ).select_related(
             'target_progress_outcome',
         )
 
@@ -144,21 +149,17 @@ class StatisticsListView(PermissionRequiredMixin, ListView):
             Dictionary of context data.
         """
         context = super().get_context_data(**kwargs)
+        crowdsourced_progress_outcomes = get_crowdsourced_progress_outcomes()
+        total_submissions = 0
         for resource in self.object_list:
-            if resource.submission_count > 0:
-                # Add top 3 selected progress outcomes
-                # TODO: Perform as one query, possibly when requesting queryset
-                resource.crowdsourced_pos = ProgressOutcome.objects.filter(
-                    submissions__resource=resource
-                ).annotate(
-                    submission_count=Count('submissions')
-                ).order_by('-submission_count')[:3]
-                total_submission_count = Submission.objects.filter(resource=resource).count()
-                for crowdsourced_po in resource.crowdsourced_pos:
-                    crowdsourced_po.percentage = (crowdsourced_po.submission_count / total_submission_count) * 100
-                    if resource.target_progress_outcome != crowdsourced_po:
-                        crowdsourced_po.resource_target = True
-        context['total_submissions'] = Submission.objects.count()
+            total_submissions += resource.submission_count
+            # Add top 3 selected progress outcomes
+            resource.crowdsourced_pos = crowdsourced_progress_outcomes.get(resource.pk, [])
+            for crowdsourced_po in resource.crowdsourced_pos:
+                crowdsourced_po.percentage = (crowdsourced_po.submission_count / resource.submission_count) * 100
+                if resource.target_progress_outcome != crowdsourced_po:
+                    crowdsourced_po.resource_target = True
+        context['total_submissions'] = total_submissions
         context['submission_threshold'] = poet_settings.MINIMUM_SUBMISSIONS_PER_RESOURCE
         return context
 
@@ -179,9 +180,12 @@ class StatisticsDetailsView(PermissionRequiredMixin, DetailView):
         """
         context = super().get_context_data(**kwargs)
         context['statistics'] = True
-        total_submissions = Submission.objects.filter(resource=self.object).count()
         progress_outcomes = {x.code: x for x in ProgressOutcome.objects.annotate(
-            count=Count('submissions', filter=Q(submissions__resource=self.object)))}
+            count=Coalesce(
+                Sum('submission_counts__count', filter=Q(submission_counts__resource=self.object)),
+                0,
+            ))}
+        total_submissions = sum(progress_outcome.count for progress_outcome in progress_outcomes.values())
         for progress_outcome_code, progress_outcome in progress_outcomes.items():
             if total_submissions:
                 progress_outcome.percentage = progress_outcome.count / total_submissions
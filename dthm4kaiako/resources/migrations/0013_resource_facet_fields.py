@@ -0,0 +1,93 @@
+# Generated by Django 4.2.13 on 2026-10-18 09:12
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db import migrations, models
+from django.db.models import OuterRef
+
+FACET_FIELDS = {
+    'languages': 'language_ids',
+    'technological_areas': 'technological_area_ids',
+    'progress_outcomes': 'progress_outcome_ids',
+    'nzqa_standards': 'nzqa_standard_ids',
+    'year_levels': 'year_level_ids',
+    'curriculum_learning_areas': 'curriculum_learning_area_ids',
+}
+
+
+def populate_facet_fields(apps, schema_editor):
+    Resource = apps.get_model('resources', 'Resource')
+    values = {}
+    for field_name, array_field_name in FACET_FIELDS.items():
+        field = Resource._meta.get_field(field_name)
+        related_pks = field.remote_field.through.objects.filter(
+            **{field.m2m_field_name(): OuterRef('pk')}
+        ).order_by().values(field.m2m_reverse_field_name())
+        values[array_field_name] = ArraySubquery(related_pks)
+    Resource.objects.update(**values)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resources', '0012_auto_20220406_1551'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resource',
+            name='curriculum_learning_area_ids',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='resource',
+            name='language_ids',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='resource',
+            name='nzqa_standard_ids',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='resource',
+            name='progress_outcome_ids',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='resource',
+            name='technological_area_ids',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='resource',
+            name='year_level_ids',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, editable=False, size=None),
+        ),
+        migrations.RunPython(populate_facet_fields, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='resource',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['language_ids'], name='resources_r_languag_ee5183_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='resource',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['technological_area_ids'], name='resources_r_technol_79f68e_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='resource',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['progress_outcome_ids'], name='resources_r_progres_921232_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='resource',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['nzqa_standard_ids'], name='resources_r_nzqa_st_d58ec2_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='resource',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['year_level_ids'], name='resources_r_year_le_a85dcd_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='resource',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['curriculum_learning_area_ids'], name='resources_r_curricu_ffd2ae_gin'),
+        ),
+    ]
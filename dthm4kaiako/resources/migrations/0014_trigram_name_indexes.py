@@ -0,0 +1,38 @@
+# Generated by Django 4.2.13 on 2026-10-18 10:41
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resources', '0013_resource_facet_fields'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='curriculumlearningarea',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='curriculum_area_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='language',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='language_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='nzqastandard',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='nzqa_standard_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='progressoutcome',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='progress_outcome_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='resource',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='resource_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='technologicalarea',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='technological_area_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -4,17 +4,19 @@ from os.path import join, basename, splitext
 from re import match
 import logging
 from django.db import models
+from django.db.models import F
 from django.urls import reverse
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
 from django.utils.translation import gettext_lazy as _
+from django.contrib.postgres.fields import ArrayField
 from django.contrib.postgres.search import SearchVectorField
 from django.contrib.postgres.indexes import GinIndex
 from autoslug import AutoSlugField
 import filetype
 from utils.get_upload_filepath import get_resource_upload_path
 from utils.google_drive_api import get_google_drive_mimetype
-from utils.search_utils import concat_field_values
+from utils.search_utils import related_field_values
 from tinymce.models import HTMLField
 from users.models import Entity
 
@@ -39,6 +41,9 @@ class Language(models.Model):
 
         # Māori before English
         ordering = ['-name']
+        indexes = [
+            GinIndex(fields=['name'], name='language_name_trgm', opclasses=['gin_trgm_ops']),
+        ]
 
 
 class TechnologicalArea(models.Model):
@@ -56,6 +61,9 @@ class TechnologicalArea(models.Model):
         """Meta options for class."""
 
         ordering = ['abbreviation']
+        indexes = [
+            GinIndex(fields=['name'], name='technological_area_name_trgm', opclasses=['gin_trgm_ops']),
+        ]
 
 
 class ProgressOutcome(models.Model):
@@ -78,6 +86,9 @@ class ProgressOutcome(models.Model):
         """Meta options for class."""
 
         ordering = ['abbreviation']
+        indexes = [
+            GinIndex(fields=['name'], name='progress_outcome_name_trgm', opclasses=['gin_trgm_ops']),
+        ]
 
 
 class NZQAStandard(models.Model):
@@ -120,6 +131,9 @@ class NZQAStandard(models.Model):
 
         verbose_name = 'NZQA standard'
         ordering = ['level', 'abbreviation']
+        indexes = [
+            GinIndex(fields=['name'], name='nzqa_standard_name_trgm', opclasses=['gin_trgm_ops']),
+        ]
 
 
 class YearLevel(models.Model):
@@ -151,11 +165,37 @@ class CurriculumLearningArea(models.Model):
         """Meta options for class."""
 
         ordering = ['name']
+        indexes = [
+            GinIndex(fields=['name'], name='curriculum_area_name_trgm', opclasses=['gin_trgm_ops']),
+        ]
 
 
 class Resource(models.Model):
     """Model for a resource."""
 
+    # Many to many fields mirrored into array fields for facet filtering,
+    # kept up to date by the signals of this application.
+    FACET_FIELDS = {
+        'languages': 'language_ids',
+        'technological_areas': 'technological_area_ids',
+        'progress_outcomes': 'progress_outcome_ids',
+        'nzqa_standards': 'nzqa_standard_ids',
+        'year_levels': 'year_level_ids',
+        'curriculum_learning_areas': 'curriculum_learning_area_ids',
+    }
+    # Fields of related objects included in the search index, the
+    # index is updated by signals when these objects are changed.
+    SEARCH_RELATED_FIELDS = {
+        'author_entities': ('name', ),
+        'author_users': ('first_name', 'last_name'),
+        'languages': ('name', ),
+        'technological_areas': ('name', 'abbreviation'),
+        'progress_outcomes': ('name', 'abbreviation'),
+        'nzqa_standards': ('name', 'abbreviation'),
+        'year_levels': ('level', ),
+        'curriculum_learning_areas': ('name', ),
+    }
+
     name = models.CharField(max_length=200)
     slug = AutoSlugField(populate_from='name', always_update=True, null=True)
     description = HTMLField()
@@ -202,6 +242,12 @@ class Resource(models.Model):
         related_name='resources',
         blank=True,
     )
+    language_ids = ArrayField(models.BigIntegerField(), default=list, blank=True, editable=False)
+    technological_area_ids = ArrayField(models.BigIntegerField(), default=list, blank=True, editable=False)
+    progress_outcome_ids = ArrayField(models.BigIntegerField(), default=list, blank=True, editable=False)
+    nzqa_standard_ids = ArrayField(models.BigIntegerField(), default=list, blank=True, editable=False)
+    year_level_ids = ArrayField(models.BigIntegerField(), default=list, blank=True, editable=False)
+    curriculum_learning_area_ids = ArrayField(models.BigIntegerField(), default=list, blank=True, editable=False)
 
     def get_absolute_url(self):
         """Return URL of object on website.
@@ -219,34 +265,37 @@ class Resource(models.Model):
         """
         return self.name
 
-    def index_contents(self):
-        """Return dictionary for search indexing.
+    @classmethod
+    def index_contents(cls):
+        """Return dictionary of expressions for search indexing.
 
         Returns:
             Dictionary of content for search indexing. The dictionary keys
             are the weightings of content, and the dictionary values
-            are strings of content to index.
+            are lists of expressions of content to index, which are
+            evaluated by the database.
         """
         return {
-            'A': self.name,
-            'B': self.description,
-            'C': concat_field_values(
-                self.author_entities.values_list('name'),
-                self.author_users.values_list('first_name', 'last_name'),
-                self.languages.values_list('name'),
-                self.technological_areas.values_list('name', 'abbreviation'),
-                self.progress_outcomes.values_list('name', 'abbreviation'),
-                self.nzqa_standards.values_list('name', 'abbreviation'),
-                self.year_levels.values_list('level'),
-                self.curriculum_learning_areas.values_list('name'),
-            ),
+            'A': [F('name')],
+            'B': [F('description')],
+            'C': [
+                related_field_values(cls, field_name, *related_field_names)
+                for field_name, related_field_names in cls.SEARCH_RELATED_FIELDS.items()
+            ],
         }
 
     class Meta:
         """Meta options for model."""
 
         indexes = [
-            GinIndex(fields=['search_vector'])
+            GinIndex(fields=['name'], name='resource_name_trgm', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['search_vector']),
+            GinIndex(fields=['language_ids']),
+            GinIndex(fields=['technological_area_ids']),
+            GinIndex(fields=['progress_outcome_ids']),
+            GinIndex(fields=['nzqa_standard_ids']),
+            GinIndex(fields=['year_level_ids']),
+            GinIndex(fields=['curriculum_learning_area_ids']),
         ]
 
 
@@ -7,23 +7,95 @@ Based off https://simonwillison.net/2017/Oct/5/django-postgresql-faceted-search/
 from django.dispatch import receiver
 from django.db.models.signals import (
     post_save,
+    pre_delete,
+    post_delete,
     m2m_changed,
 )
 
-from django.db import transaction
 from resources.models import (
     Resource,
+    ResourceComponent,
 )
-from utils.search_utils import get_search_index_updater
+from resources.utils import update_resource_facets
+from utils.cache_utils import invalidate_content_version
+from utils.search_utils import queue_search_index_update
+
+FACET_FIELD_SENDERS = {
+    getattr(Resource, field_name).through: field_name
+    for field_name in Resource.FACET_FIELDS
+}
+SEARCH_RELATED_SENDERS = {
+    Resource._meta.get_field(field_name).related_model: field_name
+    for field_name in Resource.SEARCH_RELATED_FIELDS
+}
 
 
 @receiver(post_save, sender=Resource)
-def on_save(sender, **kwargs):
-    """Trigger functions after any model save."""
-    transaction.on_commit(get_search_index_updater(kwargs['instance']))
+def on_save(sender, instance, created, **kwargs):
+    """Trigger functions after any model save.
+
+    Saving an existing resource writes its in-memory facet fields,
+    which may be older than its relationships, so they are recomputed.
+    """
+    if not created:
+        update_resource_facets([instance.pk])
+    queue_search_index_update(Resource, [instance.pk])
+    invalidate_content_version('resources')
+
+
+@receiver(post_delete, sender=Resource)
+@receiver(post_save, sender=ResourceComponent)
+@receiver(post_delete, sender=ResourceComponent)
+def on_content_changed(sender, **kwargs):
+    """Invalidate cached resource content after changes."""
+    invalidate_content_version('resources')
+
+
+def get_changed_resource_pks(sender, instance, action, reverse, pk_set):
+    """Return primary keys of resources changed by a m2m relationship change.
+
+    Clearing a relationship from the related object side does not provide
+    the affected resources, so these are recorded before the clear occurs.
 
+    Returns:
+        List of resource primary keys, or None if the change is not complete.
+    """
+    if reverse:
+        if action == 'pre_clear':
+            instance._cleared_resource_pks = get_related_resource_pks(get_m2m_field_name(sender), instance.pk)
+        elif action == 'post_clear':
+            return getattr(instance, '_cleared_resource_pks', [])
+        elif action in ('post_add', 'post_remove'):
+            return list(pk_set)
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        return [instance.pk]
+    return None
+
+
+def get_m2m_field_name(sender):
+    """Return name of resource m2m field for the given through model."""
+    for field in Resource._meta.many_to_many:
+        if field.remote_field.through == sender:
+            return field.name
+
+
+def get_related_resource_pks(field_name, related_pk):
+    """Return primary keys of resources related to an object.
+
+    Args:
+        field_name (str): Name of resource m2m field relating the object.
+        related_pk (int): Primary key of related object.
+
+    Returns:
+        List of resource primary keys.
+    """
+    field = Resource._meta.get_field(field_name)
+    return list(field.remote_field.through.objects.filter(
+        **{field.m2m_reverse_field_name(): related_pk}
+    ).values_list(field.m2m_field_name(), flat=True))
 
-def on_m2m_changed(sender, **kwargs):
+
+def on_m2m_changed(sender, instance, action, reverse, pk_set, **kwargs):
     """Update search indexes on m2m relationship changes.
 
     When a registered many to many (m2m) relationship is changed, the
@@ -35,13 +107,55 @@ def on_m2m_changed(sender, **kwargs):
     updates their index as the text may have changed it uses
     for indexing.
     """
-    instance = kwargs['instance']
-    model = kwargs['model']
-    if isinstance(instance, Resource):
-        transaction.on_commit(get_search_index_updater(instance))
-    elif issubclass(model, Resource):
-        for obj in model.objects.filter(pk__in=kwargs['pk_set']):
-            transaction.on_commit(get_search_index_updater(obj))
+    resource_pks = get_changed_resource_pks(sender, instance, action, reverse, pk_set)
+    if resource_pks:
+        queue_search_index_update(Resource, resource_pks)
+        invalidate_content_version('resources')
+
+
+def on_facet_m2m_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Update denormalised facet fields on m2m relationship changes."""
+    resource_pks = get_changed_resource_pks(sender, instance, action, reverse, pk_set)
+    if resource_pks:
+        update_resource_facets(resource_pks, [FACET_FIELD_SENDERS[sender]])
+
+
+def on_related_save(sender, instance, created, update_fields, **kwargs):
+    """Update search indexes of resources when an indexed object is changed.
+
+    For example, renaming a language requires all resources in that language
+    to be reindexed. Saves only updating fields not used in the search index
+    (for example a user's last login) are ignored. Cached resource content
+    is invalidated for new objects too, as it lists all languages.
+    """
+    field_name = SEARCH_RELATED_SENDERS[sender]
+    if update_fields and not set(update_fields) & set(Resource.SEARCH_RELATED_FIELDS[field_name]):
+        return
+    invalidate_content_version('resources')
+    if created:
+        return
+    resource_pks = get_related_resource_pks(field_name, instance.pk)
+    if resource_pks:
+        queue_search_index_update(Resource, resource_pks)
+
+
+def on_related_pre_delete(sender, instance, **kwargs):
+    """Record resources related to an indexed object before it is deleted.
+
+    Relationships are removed by the deletion without sending m2m signals.
+    """
+    instance._deleted_resource_pks = get_related_resource_pks(SEARCH_RELATED_SENDERS[sender], instance.pk)
+
+
+def on_related_post_delete(sender, instance, **kwargs):
+    """Update resources related to an indexed object after it is deleted."""
+    field_name = SEARCH_RELATED_SENDERS[sender]
+    invalidate_content_version('resources')
+    resource_pks = getattr(instance, '_deleted_resource_pks', [])
+    if resource_pks:
+        queue_search_index_update(Resource, resource_pks)
+        if field_name in Resource.FACET_FIELDS:
+            update_resource_facets(resource_pks, [field_name])
 
 
 # Register specific fields as a lot of m2m relationships exist in this website.
@@ -53,3 +167,13 @@ m2m_changed.connect(on_m2m_changed, sender=Resource.progress_outcomes.through)
 m2m_changed.connect(on_m2m_changed, sender=Resource.nzqa_standards.through)
 m2m_changed.connect(on_m2m_changed, sender=Resource.year_levels.through)
 m2m_changed.connect(on_m2m_changed, sender=Resource.curriculum_learning_areas.through)
+
+# Register facet fields, which are mirrored on the resource for filtering.
+for facet_sender in FACET_FIELD_SENDERS:
+    m2m_changed.connect(on_facet_m2m_changed, sender=facet_sender)
+
+# Register related models, which contain text used in the search index.
+for related_sender in SEARCH_RELATED_SENDERS:
+    post_save.connect(on_related_save, sender=related_sender)
+    pre_delete.connect(on_related_pre_delete, sender=related_sender)
+    post_delete.connect(on_related_post_delete, sender=related_sender)
@@ -15,4 +15,5 @@ urlpatterns = [
     path('resource/<int:pk>/', views.ResourceDetailView.as_view()),
     path('resource/<int:pk>/<slug:slug>/', views.ResourceDetailView.as_view(), name='resource'),
     path('search/', views.ResourceSearchView.as_view(), name='search'),
+    path('search/suggestions/', views.search_suggestions_json, name='search_suggestions'),
 ]
@@ -0,0 +1,184 @@
+"""Utility functions for resources application."""
+
+from urllib.parse import urlencode
+from django.db import connection
+from django.db.models import (
+    F,
+    OuterRef,
+    Q,
+    Value,
+    BooleanField,
+    CharField,
+    ExpressionWrapper,
+)
+from django.contrib.postgres.expressions import ArraySubquery
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.urls import reverse
+from django.utils.text import capfirst
+from resources.models import (
+    Resource,
+    Language,
+    TechnologicalArea,
+    ProgressOutcome,
+    NZQAStandard,
+    CurriculumLearningArea,
+)
+
+# Models suggested for search text, with the search request parameter
+# used to filter by a suggested object (None for resources).
+SEARCH_SUGGESTION_SOURCES = (
+    (Resource, None),
+    (Language, 'lang'),
+    (TechnologicalArea, 'tech_area'),
+    (ProgressOutcome, 'progress_outcome'),
+    (NZQAStandard, 'nzqa_standard'),
+    (CurriculumLearningArea, 'curriculum_area'),
+)
+SEARCH_SUGGESTION_LIMIT = 10
+
+
+def get_facet_subquery(field_name):
+    """Return subquery of related primary keys for a facet field.
+
+    Args:
+        field_name (str): Name of many to many field on resource model.
+
+    Returns:
+        ArraySubquery expression of related primary keys for the resource.
+    """
+    field = Resource._meta.get_field(field_name)
+    through = field.remote_field.through
+    related_pks = through.objects.filter(
+        **{field.m2m_field_name(): OuterRef('pk')}
+    ).order_by().values(field.m2m_reverse_field_name())
+    return ArraySubquery(related_pks)
+
+
+def update_resource_facets(resource_pks, field_names=None):
+    """Update denormalised facet fields of resources in one query.
+
+    Args:
+        resource_pks (iterable): Primary keys of resources to update.
+        field_names (iterable): Names of many to many fields to update,
+            defaults to all facet fields.
+    """
+    if field_names is None:
+        field_names = Resource.FACET_FIELDS.keys()
+    values = {
+        Resource.FACET_FIELDS[field_name]: get_facet_subquery(field_name)
+        for field_name in field_names
+    }
+    Resource.objects.filter(pk__in=resource_pks).update(**values)
+
+
+def get_facet_counts(resources, selected_pks):
+    """Return number of matching resources for each facet value.
+
+    All counts are calculated in one grouped query. The count for a facet
+    value ignores the selected values of its own facet (as values within a
+    facet are combined with OR), but applies the selected values of all
+    other facets.
+
+    Args:
+        resources (QuerySet): Resources matching the query, before any
+            facet filters are applied.
+        selected_pks (dict): Dictionary of facet field names to lists of
+            selected primary keys.
+
+    Returns:
+        Dictionary of facet field names to dictionaries of related
+        primary keys to resource counts.
+    """
+    field_names = list(Resource.FACET_FIELDS.values())
+    match_annotations = {
+        'match_' + field_name: ExpressionWrapper(
+            Q(**{field_name + '__overlap': pks}),
+            output_field=BooleanField(),
+        )
+        for field_name, pks in selected_pks.items() if pks
+    }
+    resources = resources.order_by().annotate(**match_annotations).values(
+        *field_names,
+        *match_annotations.keys(),
+    )
+    resources_sql, params = resources.query.sql_with_params()
+
+    branches = []
+    for field_name in field_names:
+        branch = 'SELECT %s, unnest(r.{})'.format(connection.ops.quote_name(field_name))
+        conditions = [
+            'r.' + connection.ops.quote_name(match_name)
+            for match_name in match_annotations if match_name != 'match_' + field_name
+        ]
+        if conditions:
+            branch += ' WHERE ' + ' AND '.join(conditions)
+        branches.append(branch)
+        params += (field_name, )
+    sql = (
+        'SELECT facet.field_name, facet.related_pk, COUNT(*) '
+        'FROM ({}) AS r CROSS JOIN LATERAL ({}) AS facet(field_name, related_pk) '
+        'GROUP BY facet.field_name, facet.related_pk'
+    ).format(resources_sql, ' UNION ALL '.join(branches))
+
+    facet_counts = {field_name: dict() for field_name in field_names}
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        for field_name, related_pk, count in cursor.fetchall():
+            facet_counts[field_name][related_pk] = count
+    return facet_counts
+
+
+def get_search_suggestions(query_text, limit=SEARCH_SUGGESTION_LIMIT):
+    """Return resources and resource tags with names similar to search text.
+
+    Trigram word similarity is used, which tolerates misspelt and
+    partially typed words, and is supported by trigram indexes.
+    All models are searched in one query.
+
+    Args:
+        query_text (str): Text to find suggestions for.
+        limit (int): Maximum number of suggestions.
+
+    Returns:
+        List of dictionaries, each containing the name, type,
+        and URL of a suggestion.
+    """
+    querysets = []
+    for model, parameter in SEARCH_SUGGESTION_SOURCES:
+        queryset = model.objects.all()
+        if model is Resource:
+            queryset = queryset.filter(published=True)
+            slug = F('slug')
+        else:
+            slug = Value('', output_field=CharField())
+        querysets.append(
+            queryset.filter(
+                name__trigram_word_similar=query_text
+            ).annotate(
+                similarity=TrigramWordSimilarity(query_text, 'name'),
+                model_name=Value(model._meta.model_name, output_field=CharField()),
+                link_slug=slug,
+            ).order_by('-similarity').values_list(
+                'pk',
+                'name',
+                'model_name',
+                'link_slug',
+                'similarity',
+            )[:limit]
+        )
+    results = querysets[0].union(*querysets[1:], all=True).order_by('-similarity')[:limit]
+
+    sources = {model._meta.model_name: (model, parameter) for model, parameter in SEARCH_SUGGESTION_SOURCES}
+    suggestions = []
+    for pk, name, model_name, slug, similarity in results:
+        model, parameter = sources[model_name]
+        if parameter:
+            url = '{}?{}'.format(reverse('resources:search'), urlencode({parameter: pk}))
+        else:
+            url = reverse('resources:resource', kwargs={'pk': pk, 'slug': slug})
+        suggestions.append({
+            'name': name,
+            'type': capfirst(model._meta.verbose_name),
+            'url': url,
+        })
+    return suggestions
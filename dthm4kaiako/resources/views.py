@@ -1,20 +1,21 @@
 """Views for resource application."""
 
 from django.views import generic
-from django.db.models import (
-    F,
-    Value,
-    BooleanField,
-    Case,
-    When,
-)
+from django.core.cache import cache
+from django.http import Http404, JsonResponse
+from django.views.decorators.http import require_http_methods
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast
 from django.contrib.postgres.search import (
     SearchQuery,
     SearchRank,
 )
 from rest_framework import viewsets
+from utils.cache_utils import get_content_version
 from utils.mixins import RedirectToCosmeticURLMixin
+from utils.pagination import KeysetPaginator, InvalidCursor
 from resources.serializers import ResourceSerializer
+from resources.utils import get_facet_counts, get_search_suggestions
 from resources.models import (
     Resource,
     ResourceComponent,
@@ -26,6 +27,11 @@ from resources.models import (
     CurriculumLearningArea,
 )
 
+SEARCH_SUGGESTION_MIN_LENGTH = 2
+# Content is invalidated by version, this limits how long other server
+# processes (which may not share the cache) can show outdated content.
+HOME_CACHE_TIMEOUT = 60 * 10
+
 
 class ResourceHomeView(generic.TemplateView):
     """View for home of resources."""
@@ -39,20 +45,39 @@ class ResourceHomeView(generic.TemplateView):
             Dictionary of context data.
         """
         context = super().get_context_data(**kwargs)
-        context['resource_count'] = Resource.objects.filter(published=True).count()
-        context['resource_component_count'] = ResourceComponent.objects.filter(resource__published=True).count()
-        context['languages'] = Language.objects.all()
-        context['latest_resources'] = Resource.objects.filter(published=True).order_by(
-            '-datetime_added').prefetch_related(
-            'progress_outcomes',
-            'year_levels',
-            'technological_areas',
-            'languages',
-            'nzqa_standards',
-            'curriculum_learning_areas',
-        )[:10]
+        cache_key = 'resources:home:{}'.format(get_content_version('resources'))
+        home_context = cache.get(cache_key)
+        if home_context is None:
+            home_context = self.get_home_context_data()
+            cache.set(cache_key, home_context, HOME_CACHE_TIMEOUT)
+        context.update(home_context)
         return context
 
+    def get_home_context_data(self):
+        """Provide the context data derived from resources.
+
+        Querysets are evaluated so the data can be cached.
+
+        Returns:
+            Dictionary of context data.
+        """
+        return {
+            'resource_count': Resource.objects.filter(published=True).count(),
+            'resource_component_count': ResourceComponent.objects.filter(resource__published=True).count(),
+            'languages': list(Language.objects.all()),
+            'latest_resources': list(Resource.objects.filter(published=True).order_by(
+                '-datetime_added').prefetch_related(
+                'author_entities',
+                'author_users',
+                'progress_outcomes',
+                'year_levels',
+                'technological_areas',
+                'languages',
+                'nzqa_standards',
+                'curriculum_learning_areas',
+            )[:10]),
+        }
+
 
 class ResourceDetailView(RedirectToCosmeticURLMixin, generic.DetailView):
     """View for a resource."""
@@ -80,6 +105,17 @@ class ResourceSearchView(generic.TemplateView):
     """View for resource search."""
 
     template_name = 'resources/search.html'
+    paginate_by = 20
+    # Search facets as tuples of request parameter, context name,
+    # model of facet values, and resource field storing facet values.
+    facets = (
+        ('lang', 'languages', Language, 'language_ids'),
+        ('tech_area', 'technological_areas', TechnologicalArea, 'technological_area_ids'),
+        ('progress_outcome', 'progress_outcomes', ProgressOutcome, 'progress_outcome_ids'),
+        ('nzqa_standard', 'nzqa_standards', NZQAStandard, 'nzqa_standard_ids'),
+        ('year_level', 'year_levels', YearLevel, 'year_level_ids'),
+        ('curriculum_area', 'curriculum_learning_areas', CurriculumLearningArea, 'curriculum_learning_area_ids'),
+    )
 
     def get_context_data(self, *args, **kwargs):
         """Return context dictionary for resource search view.
@@ -91,85 +127,50 @@ class ResourceSearchView(generic.TemplateView):
 
         # Get request query parmaters
         query_text = self.request.GET.get('q')
-        selected_languages = self.request.GET.getlist('lang')
-        selected_technological_areas = self.request.GET.getlist('tech_area')
-        selected_progress_outcomes = self.request.GET.getlist('progress_outcome')
-        selected_nzqa_standards = self.request.GET.getlist('nzqa_standard')
-        selected_year_levels = self.request.GET.getlist('year_level')
-        selected_curriculum_learning_areas = self.request.GET.getlist('curriculum_area')
+        selected_pks = dict()
+        for parameter, context_name, model, field_name in self.facets:
+            selected_pks[field_name] = [
+                int(value) for value in self.request.GET.getlist(parameter) if value.isdigit()
+            ]
 
         get_request = bool(self.request.GET)
 
-        context['languages'] = Language.objects.annotate(
-            selected=Case(
-                When(id__in=selected_languages, then=Value(True)),
-                default=Value(False),
-                output_field=BooleanField()
-            )
-        )
-        context['technological_areas'] = TechnologicalArea.objects.annotate(
-            selected=Case(
-                When(id__in=selected_technological_areas, then=Value(True)),
-                default=Value(False),
-                output_field=BooleanField()
-            )
-        )
-        context['progress_outcomes'] = ProgressOutcome.objects.annotate(
-            selected=Case(
-                When(id__in=selected_progress_outcomes, then=Value(True)),
-                default=Value(False),
-                output_field=BooleanField()
-            )
-        )
-        context['nzqa_standards'] = NZQAStandard.objects.annotate(
-            selected=Case(
-                When(id__in=selected_nzqa_standards, then=Value(True)),
-                default=Value(False),
-                output_field=BooleanField()
-            )
-        )
-        context['year_levels'] = YearLevel.objects.annotate(
-            selected=Case(
-                When(id__in=selected_year_levels, then=Value(True)),
-                default=Value(False),
-                output_field=BooleanField()
-            )
-        )
-        context['curriculum_learning_areas'] = CurriculumLearningArea.objects.annotate(
-            selected=Case(
-                When(id__in=selected_curriculum_learning_areas, then=Value(True)),
-                default=Value(False),
-                output_field=BooleanField()
-            )
-        )
+        # Published resources matching the text query, before facet filters
+        matching_resources = Resource.objects.filter(published=True)
+        if query_text:
+            query = SearchQuery(query_text, search_type="websearch")
+            matching_resources = matching_resources.filter(search_vector=query)
+
+        # Count matching resources for each facet value, so facet
+        # values without results can be hidden.
+        facet_counts = get_facet_counts(matching_resources, selected_pks)
+        for parameter, context_name, model, field_name in self.facets:
+            facet_values = list(model.objects.all())
+            for facet_value in facet_values:
+                facet_value.selected = facet_value.pk in selected_pks[field_name]
+                facet_value.result_count = facet_counts[field_name].get(facet_value.pk, 0)
+            context[context_name] = facet_values
+
         if get_request:
             context['search'] = get_request
-
-            # Start with all objects
-            results = Resource.objects.filter(published=True)
+            results = matching_resources
 
             # Filter items by tags if given in query.
-            if selected_languages:
-                results = results.filter(languages__in=selected_languages)
-            if selected_technological_areas:
-                results = results.filter(technological_areas__in=selected_technological_areas)
-            if selected_progress_outcomes:
-                results = results.filter(progress_outcomes__in=selected_progress_outcomes)
-            if selected_nzqa_standards:
-                results = results.filter(nzqa_standards__in=selected_nzqa_standards)
-            if selected_year_levels:
-                results = results.filter(year_levels__in=selected_year_levels)
-            if selected_curriculum_learning_areas:
-                results = results.filter(curriculum_learning_areas__in=selected_curriculum_learning_areas)
-
-            # Search by text query if provided
+            # Tags are mirrored in indexed array fields to avoid joins.
+            for field_name, pks in selected_pks.items():
+                if pks:
+                    results = results.filter(**{field_name + '__overlap': pks})
+
+            # Rank by text query if provided, only computed for rows
+            # matching all filters.
+            # Rank is cast to double precision so page cursors hold exact values.
             if query_text:
-                query = SearchQuery(query_text, search_type="websearch")
-                results = Resource.objects.filter(
-                    search_vector=query
-                ).annotate(
-                    rank=SearchRank(F('search_vector'), query)
-                ).filter(rank__gt=0).order_by('-rank')
+                results = results.annotate(
+                    rank=Cast(SearchRank(F('search_vector'), query), FloatField())
+                ).filter(rank__gt=0)
+                ordering = ('-rank', '-pk')
+            else:
+                ordering = ('-pk', )
 
             results = results.prefetch_related(
                 'author_entities',
@@ -180,14 +181,42 @@ class ResourceSearchView(generic.TemplateView):
                 'nzqa_standards',
                 'year_levels',
                 'curriculum_learning_areas',
-            ).distinct()
+            )
+
+            # Only fetch and prefetch the requested page of results
+            paginator = KeysetPaginator(results, ordering, self.paginate_by)
+            try:
+                page = paginator.get_page(self.request.GET.get('cursor'))
+            except InvalidCursor:
+                raise Http404('Invalid page of search results.')
+            results_count, results_count_limited = paginator.approximate_count()
 
             context['query'] = query_text
-            context['results'] = results
-            context['results_count'] = len(results)
+            context['results'] = page
+            context['results_count'] = results_count
+            context['results_count_limited'] = results_count_limited
+            if query_text and not results_count:
+                context['suggestions'] = get_search_suggestions(query_text)
+            page_query = self.request.GET.copy()
+            page_query.pop('cursor', None)
+            if 'cursor' in self.request.GET:
+                context['first_page_query'] = page_query.urlencode()
+            if page.has_next():
+                page_query['cursor'] = page.next_cursor
+                context['next_page_query'] = page_query.urlencode()
         return context
 
 
+@require_http_methods(["GET"])
+def search_suggestions_json(request):
+    """Return JSON containing suggestions for resource search text."""
+    query_text = request.GET.get('q', '').strip()
+    suggestions = []
+    if len(query_text) >= SEARCH_SUGGESTION_MIN_LENGTH:
+        suggestions = get_search_suggestions(query_text)
+    return JsonResponse({'suggestions': suggestions})
+
+
 class ResourceAPIViewSet(viewsets.ReadOnlyModelViewSet):
     """API endpoint that allows resources to be viewed."""
 
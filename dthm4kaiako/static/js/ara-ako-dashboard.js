@@ -1,6 +1,9 @@
 var dayjs = require('dayjs');
 var clock_element = document.getElementById('clock');
 var schedule_element = document.getElementById('dashboard-schedule');
+// Schedule changes are checked for at least this often, in milliseconds.
+var MAX_UPDATE_INTERVAL = 60000;
+var MIN_UPDATE_INTERVAL = 1000;
 
 
 function updateClock() {
@@ -17,15 +20,23 @@ function updateSchedule() {
         async: true,
         dataType: "json",
         success: updateScheduleHTML,
+        error: function () {
+            setTimeout(updateSchedule, MAX_UPDATE_INTERVAL);
+        },
     });
 }
 
 
 function updateScheduleHTML(data) {
     schedule_element.innerHTML = data.schedule_html;
+    // Update when the next session ends, as the schedule changes then.
+    var delay = MAX_UPDATE_INTERVAL;
+    if (data.next_change) {
+        delay = Math.min(Math.max(dayjs(data.next_change).diff(dayjs()), MIN_UPDATE_INTERVAL), MAX_UPDATE_INTERVAL);
+    }
+    setTimeout(updateSchedule, delay);
 }
 
 updateClock()
 setInterval(updateClock, 1000);
 updateSchedule()
-setInterval(updateSchedule, 10000);
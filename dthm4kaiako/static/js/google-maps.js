@@ -1,45 +1,117 @@
 window.initMap = function() {
     var map_element = document.getElementById('map');
     if (map_element !== null) {
-        var map_markers = [];
-        var infowindow = new google.maps.InfoWindow();
-        if (event_markers.length == 1) {
-            var center_lat_lng = event_markers[0].coords;
+        if (window.event_clusters_url) {
+            var map = createMap(map_element, []);
+            // Load markers within the visible area when the map stops moving.
+            map.addListener('idle', function () {
+                var bounds = map.getBounds();
+                var south_west = bounds.getSouthWest();
+                var north_east = bounds.getNorthEast();
+                var zoom = map.getZoom();
+                // Markers are already loaded if the map has only moved within loaded area.
+                if (
+                    map.loaded_bounds && map.loaded_bounds.contains(south_west) &&
+                    map.loaded_bounds.contains(north_east) && map.loaded_zoom == zoom
+                ) {
+                    return;
+                }
+                map.loaded_bounds = bounds;
+                map.loaded_zoom = zoom;
+                var bbox = [south_west.lng(), south_west.lat(), north_east.lng(), north_east.lat()];
+                $.getJSON(event_clusters_url, {bbox: bbox.join(','), zoom: zoom}, function (data) {
+                    setMarkers(map, data.locations);
+                    setClusters(map, data.clusters);
+                });
+            });
         } else {
-            var center_lat_lng = { lat: -41, lng: 174 };
+            var map = createMap(map_element, event_markers);
+            setMarkers(map, event_markers);
         }
-        var map_zoom = window.map_zoom || 5;
-        var map = new google.maps.Map(
-            map_element,
-            {
-                zoom: map_zoom,
-                center: center_lat_lng,
-            }
-        );
-
-        function addMarker(location) {
-            var marker = new google.maps.Marker({
-                position: location.coords,
-                map: map,
-                title: location.title,
-            });
-            map_markers.push(marker);
+    }
+}
 
-            marker.addListener('click', function () {
-                // Close previously opened infowindow
-                infowindow.close();
-                infowindow.setContent(location.text);
-                infowindow.open(map, marker);
-            });
+function createMap(map_element, event_markers) {
+    if (event_markers.length == 1) {
+        var center_lat_lng = event_markers[0].coords;
+    } else {
+        var center_lat_lng = { lat: -41, lng: 174 };
+    }
+    var map_zoom = window.map_zoom || 5;
+    var map = new google.maps.Map(
+        map_element,
+        {
+            zoom: map_zoom,
+            center: center_lat_lng,
         }
+    );
+    map.infowindow = new google.maps.InfoWindow();
+    map.map_markers = [];
+    map.cluster_markers = [];
+    return map;
+}
 
-        for (var i = 0; i < event_markers.length; i++) {
-            addMarker(event_markers[i]);
-        }
+function setClusters(map, clusters) {
+    // Remove existing clusters
+    for (var i = 0; i < map.cluster_markers.length; i++) {
+        map.cluster_markers[i].setMap(null);
+    }
+    map.cluster_markers = [];
 
-        if (event_markers.length > 1) {
-            var markerCluster = new MarkerClusterer(map, map_markers,
-                { imagePath: 'https://developers.google.com/maps/documentation/javascript/examples/markerclusterer/m' });
-        }
+    function addCluster(cluster) {
+        var marker = new google.maps.Marker({
+            position: cluster.coords,
+            map: map,
+            label: String(cluster.event_count),
+            title: cluster.event_count + ' events at ' + cluster.location_count + ' locations',
+        });
+        map.cluster_markers.push(marker);
+
+        // Zoom into cluster
+        marker.addListener('click', function () {
+            map.setCenter(cluster.coords);
+            map.setZoom(map.getZoom() + 2);
+        });
+    }
+
+    for (var i = 0; i < clusters.length; i++) {
+        addCluster(clusters[i]);
+    }
+}
+
+function setMarkers(map, event_markers) {
+    // Remove existing markers
+    if (map.marker_cluster) {
+        map.marker_cluster.clearMarkers();
+        map.marker_cluster = null;
+    }
+    for (var i = 0; i < map.map_markers.length; i++) {
+        map.map_markers[i].setMap(null);
+    }
+    map.map_markers = [];
+
+    function addMarker(location) {
+        var marker = new google.maps.Marker({
+            position: location.coords,
+            map: map,
+            title: location.title,
+        });
+        map.map_markers.push(marker);
+
+        marker.addListener('click', function () {
+            // Close previously opened infowindow
+            map.infowindow.close();
+            map.infowindow.setContent(location.text);
+            map.infowindow.open(map, marker);
+        });
+    }
+
+    for (var i = 0; i < event_markers.length; i++) {
+        addMarker(event_markers[i]);
+    }
+
+    if (event_markers.length > 1) {
+        map.marker_cluster = new MarkerClusterer(map, map.map_markers,
+            { imagePath: 'https://developers.google.com/maps/documentation/javascript/examples/markerclusterer/m' });
     }
 }
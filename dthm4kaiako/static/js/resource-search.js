@@ -3,8 +3,14 @@ $(document).ready(function () {
     updateFilterSummary();
     $('#clear-form').click(resetResourceSearchForm);
     $('#resource-search input[type=checkbox]').change(updateFilterSummary);
+    $('#resource-search #id_q').on('input', queueSearchSuggestions);
 });
 
+var SUGGESTION_MIN_LENGTH = 2;
+var SUGGESTION_DELAY = 250;
+var suggestion_timeout = null;
+var suggestion_request = null;
+
 function resetResourceSearchForm() {
     /**
      * Clear all elements of form.
@@ -26,7 +32,9 @@ function updateFilterSummary() {
 
     $('#resource-search input[type=checkbox]:checked').each(function () {
         filter_count++;
-        var label = $("label[for='" + $(this).attr('id') + "']");
+        var label = $("label[for='" + $(this).attr('id') + "']").clone();
+        // Remove result count from badge.
+        label.find('small').remove();
         $summary_badges.append(label.html());
     });
 
@@ -36,3 +44,35 @@ function updateFilterSummary() {
         $summary_text.text(filter_count + ' filters applied');
     }
 };
+
+
+function queueSearchSuggestions() {
+    /**
+     * Request search suggestions once typing has paused.
+     */
+    clearTimeout(suggestion_timeout);
+    suggestion_timeout = setTimeout(updateSearchSuggestions, SUGGESTION_DELAY);
+};
+
+
+function updateSearchSuggestions() {
+    /**
+     * Update the list of suggestions for the search text.
+     */
+    var $input = $('#resource-search #id_q');
+    var $suggestions = $('#search-suggestions');
+    var query = $.trim($input.val());
+    if (suggestion_request) {
+        suggestion_request.abort();
+    }
+    if (query.length < SUGGESTION_MIN_LENGTH) {
+        $suggestions.empty();
+        return;
+    }
+    suggestion_request = $.getJSON($input.data('suggestions-url'), {q: query}, function (data) {
+        $suggestions.empty();
+        $.each(data.suggestions, function (index, suggestion) {
+            $('<option>').val(suggestion.name).text(suggestion.type).appendTo($suggestions);
+        });
+    });
+};
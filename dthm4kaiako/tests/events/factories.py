@@ -121,4 +121,6 @@ class EventFactory(DjangoModelFactory):
                 session.save()
             # Set start time for next session as end time for this session
             start_time = end_time
-        self.update_datetimes()
+        # Read values set by database triggers and signals, so they are
+        # not overwritten when factory-boy saves the event
+        self.refresh_from_db(fields=['start', 'end', 'location_summary', 'location_count'])
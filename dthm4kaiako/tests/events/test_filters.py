@@ -0,0 +1,56 @@
+"""Test class for events filters module."""
+
+from datetime import timedelta
+from django.contrib.gis.geos import Point
+from django.utils.timezone import now
+from tests.BaseTestWithDB import BaseTestWithDB
+from events.models import (
+    Event,
+    Location,
+)
+from events.filters import UpcomingEventFilter
+
+
+class UpcomingEventFilterTest(BaseTestWithDB):
+    """Test class for upcoming event filter."""
+
+    def setUp(self):
+        super().setUp()
+        self.event = Event.objects.create(
+            name='Event 1',
+            description='description',
+            published=True,
+            start=now() + timedelta(days=1),
+            end=now() + timedelta(days=1, hours=1),
+        )
+        for name in ('Location 1', 'Location 2'):
+            self.event.locations.add(Location.objects.create(
+                name=name,
+                city='Christchurch',
+                region=Location.REGION_CANTERBURY,
+                coords=Point(172.6, -43.5),
+            ))
+
+    def test_region_filter_without_duplicates(self):
+        event_filter = UpcomingEventFilter(
+            {'locations__region': str(Location.REGION_CANTERBURY)},
+            queryset=Event.objects.all(),
+        )
+        self.assertEqual(list(event_filter.qs), [self.event])
+
+    def test_region_filter_excludes_other_regions(self):
+        event_filter = UpcomingEventFilter(
+            {'locations__region': str(Location.REGION_NORTHLAND)},
+            queryset=Event.objects.all(),
+        )
+        self.assertEqual(list(event_filter.qs), [])
+
+    def test_events_without_start_included(self):
+        event = Event.objects.create(
+            name='Event 2',
+            description='description',
+            published=True,
+            end=now() + timedelta(days=2),
+        )
+        event_filter = UpcomingEventFilter({}, queryset=Event.objects.all())
+        self.assertEqual(list(event_filter.qs), [self.event, event])
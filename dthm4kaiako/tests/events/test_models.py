@@ -0,0 +1,65 @@
+"""Test class for events models module."""
+
+from datetime import timedelta
+from django.utils.timezone import now
+from tests.BaseTestWithDB import BaseTestWithDB
+from events.models import (
+    Event,
+    Session,
+)
+
+
+class EventDatetimesTest(BaseTestWithDB):
+    """Test class for event datetimes maintained from sessions."""
+
+    def setUp(self):
+        super().setUp()
+        self.event = Event.objects.create(name='Event 1', description='description')
+        self.start = now().replace(microsecond=0) + timedelta(days=1)
+
+    def create_session(self, hours_from_start, duration):
+        return Session(
+            name='Session',
+            event=self.event,
+            start=self.start + timedelta(hours=hours_from_start),
+            end=self.start + timedelta(hours=hours_from_start + duration),
+        )
+
+    def test_datetimes_updated_on_bulk_create(self):
+        Session.objects.bulk_create([self.create_session(2, 1), self.create_session(0, 1)])
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.start, self.start)
+        self.assertEqual(self.event.end, self.start + timedelta(hours=3))
+
+    def test_datetimes_updated_on_queryset_update(self):
+        self.create_session(0, 1).save()
+        self.event.sessions.update(end=self.start + timedelta(hours=5))
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.end, self.start + timedelta(hours=5))
+
+    def test_datetimes_updated_on_delete(self):
+        self.create_session(0, 1).save()
+        late_session = self.create_session(4, 1)
+        late_session.save()
+        late_session.delete()
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.start, self.start)
+        self.assertEqual(self.event.end, self.start + timedelta(hours=1))
+
+    def test_datetimes_cleared_on_delete_of_all_sessions(self):
+        self.create_session(0, 1).save()
+        self.event.sessions.all().delete()
+        self.event.refresh_from_db()
+        self.assertIsNone(self.event.start)
+        self.assertIsNone(self.event.end)
+
+    def test_datetimes_kept_on_save_of_stale_instance(self):
+        self.create_session(0, 1).save()
+        # Only the event row is written, without reading sessions or locations
+        with self.assertNumQueries(1):
+            self.event.name = 'Event 2'
+            self.event.save()
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.name, 'Event 2')
+        self.assertEqual(self.event.start, self.start)
+        self.assertEqual(self.event.end, self.start + timedelta(hours=1))
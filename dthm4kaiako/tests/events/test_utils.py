@@ -0,0 +1,298 @@
+"""Test class for events utils module."""
+
+from datetime import datetime, timedelta
+from django.contrib.gis.geos import Point
+from django.core.cache import cache
+from django.http import QueryDict
+from django.utils.timezone import make_aware, now
+from tests.BaseTestWithDB import BaseTestWithDB
+from events.models import (
+    Event,
+    Location,
+    Session,
+)
+from events.utils import (
+    get_event_map_locations,
+    get_event_map_clusters,
+    get_event_schedule,
+    organise_schedule_data,
+    parse_map_area,
+)
+
+
+class OrganiseScheduleDataTest(BaseTestWithDB):
+    """Test class for organise_schedule_data function."""
+
+    def create_session(self, name, start, end):
+        return Session(name=name, start=make_aware(start), end=make_aware(end))
+
+    def get_schedule(self, sessions):
+        return [
+            (day.date, [[session.name for session in time_slot.sessions] for time_slot in day.time_slots])
+            for day in organise_schedule_data(sessions)
+        ]
+
+    def test_empty(self):
+        self.assertEqual(organise_schedule_data([]), [])
+
+    def test_sessions_on_different_days(self):
+        sessions = [
+            self.create_session('Day 2', datetime(2030, 1, 2, 9), datetime(2030, 1, 2, 10)),
+            self.create_session('Day 1 afternoon', datetime(2030, 1, 1, 13), datetime(2030, 1, 1, 14)),
+            self.create_session('Day 1 morning', datetime(2030, 1, 1, 9), datetime(2030, 1, 1, 10)),
+        ]
+        self.assertEqual(self.get_schedule(sessions), [
+            (datetime(2030, 1, 1).date(), [['Day 1 morning'], ['Day 1 afternoon']]),
+            (datetime(2030, 1, 2).date(), [['Day 2']]),
+        ])
+
+    def test_sessions_sharing_time_slot(self):
+        sessions = [
+            self.create_session('Session 1', datetime(2030, 1, 1, 9), datetime(2030, 1, 1, 10)),
+            self.create_session('Longer session', datetime(2030, 1, 1, 9), datetime(2030, 1, 1, 11)),
+            self.create_session('Session 2', datetime(2030, 1, 1, 9), datetime(2030, 1, 1, 10)),
+        ]
+        schedule_data = organise_schedule_data(sessions)
+        self.assertEqual(self.get_schedule(sessions), [
+            (datetime(2030, 1, 1).date(), [['Session 1', 'Session 2'], ['Longer session']]),
+        ])
+        time_slot = schedule_data[0].time_slots[0]
+        self.assertEqual(time_slot.start, make_aware(datetime(2030, 1, 1, 9)))
+        self.assertEqual(time_slot.end, make_aware(datetime(2030, 1, 1, 10)))
+
+    def test_session_crossing_midnight(self):
+        sessions = [
+            self.create_session('Overnight', datetime(2030, 1, 1, 23), datetime(2030, 1, 2, 1)),
+            self.create_session('Breakfast', datetime(2030, 1, 2, 8), datetime(2030, 1, 2, 9)),
+        ]
+        self.assertEqual(self.get_schedule(sessions), [
+            (datetime(2030, 1, 1).date(), [['Overnight']]),
+            (datetime(2030, 1, 2).date(), [['Breakfast']]),
+        ])
+
+
+class EventMapLocationsTest(BaseTestWithDB):
+    """Test class for event map locations."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.location = Location.objects.create(
+            name='Location <1>',
+            city='Christchurch',
+            region=Location.REGION_CANTERBURY,
+            coords=Point(172.6, -43.5),
+        )
+
+    def create_event(self, name, days_from_now, published=True):
+        event = Event.objects.create(
+            name=name,
+            description='description',
+            published=published,
+            start=now() + timedelta(days=days_from_now),
+            end=now() + timedelta(days=days_from_now, hours=1),
+        )
+        event.locations.add(self.location)
+        return event
+
+    def test_map_locations_grouped_by_location(self):
+        event_1 = self.create_event('Event 1', 2)
+        event_2 = self.create_event('Event 2', 1)
+        self.create_event('Past event', -1)
+        self.create_event('Unpublished event', 1, published=False)
+        map_locations = get_event_map_locations()
+        self.assertEqual(len(map_locations), 1)
+        self.assertEqual(map_locations[0]['coords'], {'lat': -43.5, 'lng': 172.6})
+        self.assertIn('Location &lt;1&gt;', map_locations[0]['text'])
+        text = map_locations[0]['text']
+        self.assertLess(text.index(event_2.get_absolute_url()), text.index(event_1.get_absolute_url()))
+        self.assertNotIn('Past event', text)
+        self.assertNotIn('Unpublished event', text)
+
+    def test_map_locations_updated_on_event_change(self):
+        event = self.create_event('Event 1', 1)
+        self.assertIn('Event 1', get_event_map_locations()[0]['text'])
+        event.name = 'Renamed event'
+        event.save()
+        self.assertIn('Renamed event', get_event_map_locations()[0]['text'])
+
+    def test_map_locations_within_radius_ordered_by_distance(self):
+        far_location = Location.objects.create(
+            name='Location 2',
+            city='Wellington',
+            region=Location.REGION_WELLINGTON,
+            coords=Point(174.8, -41.3),
+        )
+        event = self.create_event('Event 1', 1)
+        event.locations.add(far_location)
+        area = parse_map_area(QueryDict('lat=-41.3&lng=174.8&radius=500'))
+        map_locations = get_event_map_locations(area)
+        self.assertEqual([location['title'] for location in map_locations], ['Location 2', 'Location <1>'])
+        area = parse_map_area(QueryDict('lat=-41.3&lng=174.8&radius=100'))
+        map_locations = get_event_map_locations(area)
+        self.assertEqual([location['title'] for location in map_locations], ['Location 2'])
+
+    def test_map_locations_within_bounding_box(self):
+        self.create_event('Event 1', 1)
+        area = parse_map_area(QueryDict('bbox=172,-44,173,-43'))
+        self.assertEqual(len(get_event_map_locations(area)), 1)
+        area = parse_map_area(QueryDict('bbox=174,-42,175,-41'))
+        self.assertEqual(get_event_map_locations(area), [])
+
+    def test_parse_map_area_invalid(self):
+        for query in ('bbox=1,2,3', 'bbox=a,b,c,d', 'lat=-41&lng=174', 'lat=-41&lng=174&radius=100000'):
+            with self.assertRaises(ValueError):
+                parse_map_area(QueryDict(query))
+        self.assertIsNone(parse_map_area(QueryDict('')))
+
+    def test_map_clusters_group_nearby_locations(self):
+        nearby_location = Location.objects.create(
+            name='Location 2',
+            city='Christchurch',
+            region=Location.REGION_CANTERBURY,
+            coords=Point(172.61, -43.51),
+        )
+        event = self.create_event('Event 1', 1)
+        event.locations.add(nearby_location)
+        self.create_event('Event 2', 2)
+        area = parse_map_area(QueryDict('bbox=166,-48,179,-34'))
+        map_clusters = get_event_map_clusters(area, 5)
+        self.assertEqual(len(map_clusters['clusters']), 1)
+        self.assertEqual(map_clusters['clusters'][0]['location_count'], 2)
+        self.assertEqual(map_clusters['clusters'][0]['event_count'], 2)
+        self.assertEqual(map_clusters['locations'], [])
+        map_clusters = get_event_map_clusters(area, 15)
+        self.assertEqual(map_clusters['clusters'], [])
+        self.assertEqual(len(map_clusters['locations']), 2)
+
+
+class EventLocationSummaryTest(BaseTestWithDB):
+    """Test class for stored event location summaries."""
+
+    def setUp(self):
+        super().setUp()
+        self.location_1 = Location.objects.create(
+            name='Location 1',
+            city='Christchurch',
+            region=Location.REGION_CANTERBURY,
+            coords=Point(172.6, -43.5),
+        )
+        self.location_2 = Location.objects.create(
+            name='Location 2',
+            city='Wellington',
+            region=Location.REGION_WELLINGTON,
+            coords=Point(174.8, -41.3),
+        )
+        self.event = Event.objects.create(name='Event 1', description='description')
+
+    def test_summary_single_location(self):
+        self.event.locations.add(self.location_1)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.location_summary, 'Christchurch, Canterbury region')
+        self.assertEqual(self.event.location_count, 1)
+
+    def test_summary_multiple_locations(self):
+        self.event.locations.add(self.location_1, self.location_2)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.location_summary, 'Multiple locations')
+        self.assertEqual(self.event.location_count, 2)
+
+    def test_summary_kept_on_save_of_stale_instance(self):
+        self.event.locations.add(self.location_1)
+        self.event.name = 'Event 2'
+        self.event.save()
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.location_summary, 'Christchurch, Canterbury region')
+        self.assertEqual(self.event.location_count, 1)
+
+    def test_summary_updated_on_reverse_clear(self):
+        self.event.locations.add(self.location_1)
+        self.location_1.events.clear()
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.location_summary, '')
+        self.assertEqual(self.event.location_count, 0)
+
+    def test_summary_updated_on_location_change(self):
+        self.event.locations.add(self.location_1)
+        self.location_1.city = 'Rangiora'
+        self.location_1.save()
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.location_summary, 'Rangiora, Canterbury region')
+
+    def test_summary_updated_on_location_delete(self):
+        self.event.locations.add(self.location_1, self.location_2)
+        self.location_2.delete()
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.location_summary, 'Christchurch, Canterbury region')
+
+
+class EventScheduleTest(BaseTestWithDB):
+    """Test class for cached event schedules."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.event = Event.objects.create(name='Event 1', description='description')
+        self.session = Session.objects.create(
+            name='Session 1',
+            event=self.event,
+            start=now() + timedelta(days=1),
+            end=now() + timedelta(days=1, hours=1),
+        )
+        Session.objects.create(
+            name='Past session',
+            event=self.event,
+            start=now() - timedelta(days=1),
+            end=now() - timedelta(days=1, hours=-1),
+        )
+
+    def test_schedule_upcoming_only(self):
+        schedule = get_event_schedule(self.event, upcoming_only=True)
+        self.assertIn('Session 1', schedule['html'])
+        self.assertNotIn('Past session', schedule['html'])
+        self.assertEqual(len(schedule['days']), 1)
+        self.assertEqual(schedule['next_change'], self.session.end)
+        self.assertIn('Past session', get_event_schedule(self.event)['html'])
+
+    def test_schedule_etag_changed_on_session_change(self):
+        etag = get_event_schedule(self.event)['etag']
+        self.assertEqual(get_event_schedule(self.event)['etag'], etag)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.session.name = 'Renamed session'
+            self.session.save()
+        schedule = get_event_schedule(self.event)
+        self.assertIn('Renamed session', schedule['html'])
+        self.assertNotEqual(schedule['etag'], etag)
+
+    def test_schedule_changed_on_session_locations_change(self):
+        location = Location.objects.create(
+            name='Location 1',
+            city='Christchurch',
+            region=Location.REGION_CANTERBURY,
+            coords=Point(172.6, -43.5),
+        )
+        self.assertNotIn('Location 1', get_event_schedule(self.event)['html'])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.session.locations.add(location)
+        self.assertIn('Location 1', get_event_schedule(self.event)['html'])
+
+    def test_schedule_changed_without_content_version(self):
+        # Another server process does not run this process's commit callbacks
+        get_event_schedule(self.event)
+        with self.captureOnCommitCallbacks():
+            self.session.name = 'Renamed session'
+            self.session.save()
+        self.assertIn('Renamed session', get_event_schedule(self.event)['html'])
+
+    def test_schedule_changed_on_session_location_delete(self):
+        location = Location.objects.create(
+            name='Location 1',
+            city='Christchurch',
+            region=Location.REGION_CANTERBURY,
+            coords=Point(172.6, -43.5),
+        )
+        self.session.locations.add(location)
+        self.assertIn('Location 1', get_event_schedule(self.event)['html'])
+        with self.captureOnCommitCallbacks():
+            location.delete()
+        self.assertNotIn('Location 1', get_event_schedule(self.event)['html'])
@@ -0,0 +1,95 @@
+"""Test class for events views module."""
+
+from datetime import timedelta
+from django.contrib.gis.geos import Point
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils.timezone import now
+from tests.BaseTestWithDB import BaseTestWithDB
+from events.models import (
+    Event,
+    Location,
+    Session,
+)
+
+
+class EventsCalendarTest(BaseTestWithDB):
+    """Test class for events calendar view."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.event = Event.objects.create(
+            name='Event, with comma',
+            description='<p>Description</p>',
+            published=True,
+            start=now() + timedelta(days=1),
+            end=now() + timedelta(days=1, hours=1),
+        )
+        Event.objects.create(
+            name='Past event',
+            description='description',
+            published=True,
+            start=now() - timedelta(days=7),
+            end=now() - timedelta(days=7),
+        )
+
+    def test_events_calendar(self):
+        response = self.client.get(reverse('events:calendar'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/calendar; charset=utf-8')
+        content = b''.join(response.streaming_content).decode()
+        self.assertTrue(content.startswith('BEGIN:VCALENDAR\r\n'))
+        self.assertIn('SUMMARY:Event\\, with comma\r\n', content)
+        self.assertIn('DESCRIPTION:Description\r\n', content)
+        self.assertNotIn('Past event', content)
+
+    def test_events_calendar_not_modified(self):
+        response = self.client.get(reverse('events:calendar'))
+        response = self.client.get(reverse('events:calendar'), HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_events_calendar_modified_on_event_change(self):
+        etag = self.client.get(reverse('events:calendar'))['ETag']
+        # Validators are read from the database, not from cached versions
+        # changed when the transaction is committed
+        self.event.name = 'Renamed event'
+        self.event.save()
+        response = self.client.get(reverse('events:calendar'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_events_calendar_modified_on_event_delete(self):
+        Event.objects.create(
+            name='Event 2',
+            description='description',
+            published=True,
+            start=now() + timedelta(days=2),
+            end=now() + timedelta(days=2, hours=1),
+        )
+        etag = self.client.get(reverse('events:calendar'))['ETag']
+        self.event.delete()
+        response = self.client.get(reverse('events:calendar'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_sessions_calendar_modified_on_session_locations_change(self):
+        self.event.show_schedule = True
+        self.event.save()
+        session = Session.objects.create(
+            name='Session 1',
+            event=self.event,
+            start=now() + timedelta(days=1),
+            end=now() + timedelta(days=1, hours=1),
+        )
+        location = Location.objects.create(
+            name='Location 1',
+            city='Christchurch',
+            region=Location.REGION_CANTERBURY,
+            coords=Point(172.6, -43.5),
+        )
+        url = reverse('events:event_calendar', kwargs={'pk': self.event.pk})
+        etag = self.client.get(url)['ETag']
+        session.locations.add(location)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Location 1', b''.join(response.streaming_content).decode())
@@ -0,0 +1 @@
+"""Module for testing the general application."""
@@ -0,0 +1,66 @@
+"""Test class for general management commands."""
+
+from contextlib import redirect_stdout
+from io import StringIO
+from django.core import management
+from django.test import TransactionTestCase
+from tests.BaseTestWithDB import BaseTestWithDB
+from resources.models import Resource
+
+
+class RebuildSearchIndexesTest(BaseTestWithDB):
+    """Test class for rebuild_search_indexes command."""
+
+    def setUp(self):
+        super().setUp()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.resources = [
+                Resource.objects.create(name='resource-{}'.format(i), description='description')
+                for i in range(3)
+            ]
+
+    def call_command(self, *args):
+        output = StringIO()
+        with redirect_stdout(output):
+            management.call_command('rebuild_search_indexes', *args)
+        return output.getvalue()
+
+    def test_unchanged_rows_skipped(self):
+        Resource.objects.filter(pk=self.resources[1].pk).update(search_vector=None)
+        output = self.call_command('--chunk-size=1')
+        self.assertIn('for 1 of 3 resources (3 chunks)', output)
+        self.assertEqual(
+            list(Resource.objects.filter(search_vector='resource-1')),
+            [self.resources[1]]
+        )
+
+    def test_all_rows_written(self):
+        output = self.call_command('--all')
+        self.assertIn('for 3 of 3 resources (1 chunks)', output)
+
+    def test_no_resources(self):
+        Resource.objects.all().delete()
+        self.assertIn('No resources to index.', self.call_command())
+
+
+class RebuildSearchIndexesWorkersTest(TransactionTestCase):
+    """Test class for rebuild_search_indexes command with worker processes.
+
+    Worker processes use their own connections, so rows are committed
+    rather than created within a test transaction.
+    """
+
+    def test_chunks_rebuilt_by_workers(self):
+        resources = [
+            Resource.objects.create(name='resource-{}'.format(i), description='description')
+            for i in range(4)
+        ]
+        Resource.objects.filter(pk__in=[resources[0].pk, resources[3].pk]).update(search_vector=None)
+        output = StringIO()
+        with redirect_stdout(output):
+            management.call_command('rebuild_search_indexes', '--chunk-size=2', '--workers=2')
+        self.assertIn('for 2 of 4 resources (2 chunks)', output.getvalue())
+        self.assertEqual(
+            Resource.objects.filter(search_vector='description').count(),
+            4
+        )
@@ -0,0 +1,33 @@
+"""Test class for POET forms module."""
+
+from tests.BaseTestWithDB import BaseTestWithDB
+from poet.forms import POETSurveyForm
+from poet.models import (
+    ProgressOutcome,
+    Resource,
+)
+from poet.utils import get_progress_outcome_catalogue
+
+
+class POETSurveyFormTest(BaseTestWithDB):
+    """Test class for POETSurveyForm."""
+
+    def setUp(self):
+        super().setUp()
+        self.progress_outcome = ProgressOutcome.objects.create(code='PO-1', label='PO 1', short_label='1')
+        self.resources = [
+            Resource.objects.create(
+                title='Resource {}'.format(number),
+                target_progress_outcome=self.progress_outcome,
+            )
+            for number in range(5)
+        ]
+
+    def test_progress_outcome_catalogue_read_once(self):
+        get_progress_outcome_catalogue()
+        # Only the state of progress outcomes is read, for all fields
+        with self.assertNumQueries(1):
+            form = POETSurveyForm()
+            form.add_fields_from_resources(self.resources)
+        for i in range(len(self.resources)):
+            self.assertEqual(form.fields['choice' + str(i)].choices, [('PO-1', '1')])
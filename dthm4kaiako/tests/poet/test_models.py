@@ -0,0 +1,47 @@
+"""Test class for POET models module."""
+
+from django.core import management
+from tests.BaseTestWithDB import BaseTestWithDB
+from poet.models import (
+    ProgressOutcome,
+    Resource,
+    Submission,
+    SubmissionCount,
+)
+
+
+class SubmissionCountTest(BaseTestWithDB):
+    """Test class for SubmissionCount model."""
+
+    def setUp(self):
+        super().setUp()
+        self.progress_outcome_1 = ProgressOutcome.objects.create(code='PO-1', label='PO 1')
+        self.progress_outcome_2 = ProgressOutcome.objects.create(code='PO-2', label='PO 2')
+        self.resource = Resource.objects.create(
+            title='Resource 1',
+            target_progress_outcome=self.progress_outcome_1,
+        )
+
+    def get_counts(self):
+        return dict(SubmissionCount.objects.values_list('progress_outcome', 'count'))
+
+    def test_counts_maintained_on_submission_writes(self):
+        Submission.objects.bulk_create([
+            Submission(resource=self.resource, progress_outcome=self.progress_outcome_1),
+            Submission(resource=self.resource, progress_outcome=self.progress_outcome_1),
+            Submission(resource=self.resource, progress_outcome=self.progress_outcome_2),
+        ])
+        self.assertEqual(self.get_counts(), {self.progress_outcome_1.pk: 2, self.progress_outcome_2.pk: 1})
+        Submission.objects.filter(progress_outcome=self.progress_outcome_2).update(
+            progress_outcome=self.progress_outcome_1,
+        )
+        self.assertEqual(self.get_counts(), {self.progress_outcome_1.pk: 3})
+        Submission.objects.all().delete()
+        self.assertEqual(self.get_counts(), {})
+
+    def test_reconcile_command(self):
+        Submission.objects.create(resource=self.resource, progress_outcome=self.progress_outcome_1)
+        SubmissionCount.objects.all().update(count=5)
+        SubmissionCount.objects.create(resource=self.resource, progress_outcome=self.progress_outcome_2, count=1)
+        management.call_command('reconcile_poet_submission_counts')
+        self.assertEqual(self.get_counts(), {self.progress_outcome_1.pk: 1})
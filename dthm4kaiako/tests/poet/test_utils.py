@@ -0,0 +1,107 @@
+"""Test class for POET utils module."""
+
+from tests.BaseTestWithDB import BaseTestWithDB
+from poet.models import (
+    ProgressOutcome,
+    ProgressOutcomeGroup,
+    Resource,
+    Submission,
+    SubmissionCount,
+)
+from poet.utils import (
+    select_resources_for_poet_form,
+    get_crowdsourced_progress_outcomes,
+    get_progress_outcome_catalogue,
+)
+
+
+class SelectResourcesForPOETFormTest(BaseTestWithDB):
+    """Test class for select_resources_for_poet_form function."""
+
+    def setUp(self):
+        super().setUp()
+        self.progress_outcome = ProgressOutcome.objects.create(code='PO-1', label='PO 1')
+        self.progress_outcome_group = ProgressOutcomeGroup.objects.create(name='Group 1', active=True)
+        self.progress_outcome_group.progress_outcomes.add(self.progress_outcome)
+        self.resources = [
+            Resource.objects.create(
+                title='Resource {}'.format(number),
+                active=True,
+                target_progress_outcome=self.progress_outcome,
+            )
+            for number in range(6)
+        ]
+
+    def test_resources_below_minimum_submissions_prioritised(self):
+        SubmissionCount.objects.bulk_create([
+            SubmissionCount(resource=resource, progress_outcome=self.progress_outcome, count=100)
+            for resource in self.resources[:3]
+        ])
+        for i in range(5):
+            self.assertEqual(
+                select_resources_for_poet_form(self.progress_outcome_group),
+                sorted(resource.pk for resource in self.resources[3:]),
+            )
+
+    def test_inactive_resources_excluded(self):
+        Resource.objects.filter(pk__in=[resource.pk for resource in self.resources[3:]]).update(active=False)
+        self.assertEqual(
+            select_resources_for_poet_form(self.progress_outcome_group),
+            sorted(resource.pk for resource in self.resources[:3]),
+        )
+
+
+class GetCrowdsourcedProgressOutcomesTest(BaseTestWithDB):
+    """Test class for get_crowdsourced_progress_outcomes function."""
+
+    def setUp(self):
+        super().setUp()
+        self.progress_outcomes = [
+            ProgressOutcome.objects.create(code='PO-{}'.format(number), label='PO {}'.format(number))
+            for number in range(1, 6)
+        ]
+        self.resource = Resource.objects.create(
+            title='Resource 1',
+            target_progress_outcome=self.progress_outcomes[0],
+        )
+        self.resource_without_submissions = Resource.objects.create(
+            title='Resource 2',
+            target_progress_outcome=self.progress_outcomes[0],
+        )
+        for progress_outcome, count in zip(self.progress_outcomes, (1, 4, 2, 3, 2)):
+            for i in range(count):
+                Submission.objects.create(resource=self.resource, progress_outcome=progress_outcome)
+
+    def test_top_progress_outcomes(self):
+        with self.assertNumQueries(1):
+            crowdsourced_progress_outcomes = get_crowdsourced_progress_outcomes()
+        self.assertEqual(list(crowdsourced_progress_outcomes), [self.resource.pk])
+        top_progress_outcomes = crowdsourced_progress_outcomes[self.resource.pk]
+        self.assertEqual(
+            top_progress_outcomes,
+            [self.progress_outcomes[1], self.progress_outcomes[3], self.progress_outcomes[2]]
+        )
+        self.assertEqual([po.submission_count for po in top_progress_outcomes], [4, 3, 2])
+
+
+class GetProgressOutcomeCatalogueTest(BaseTestWithDB):
+    """Test class for get_progress_outcome_catalogue function."""
+
+    def setUp(self):
+        super().setUp()
+        self.progress_outcome = ProgressOutcome.objects.create(code='PO-1', label='PO 1', short_label='1')
+
+    def test_catalogue_reused_until_progress_outcomes_change(self):
+        catalogue = get_progress_outcome_catalogue()
+        # Only the state of progress outcomes is read
+        with self.assertNumQueries(1):
+            self.assertIs(get_progress_outcome_catalogue(), catalogue)
+        self.progress_outcome.short_label = 'One'
+        self.progress_outcome.save()
+        self.assertEqual(get_progress_outcome_catalogue().choices, [('PO-1', 'One')])
+
+    def test_catalogue_reloaded_after_delete(self):
+        ProgressOutcome.objects.create(code='PO-2', label='PO 2', short_label='2')
+        get_progress_outcome_catalogue()
+        self.progress_outcome.delete()
+        self.assertEqual(get_progress_outcome_catalogue().choices, [('PO-2', '2')])
@@ -0,0 +1,151 @@
+"""Test class for resources utils module."""
+
+from django.core.cache import cache
+from tests.BaseTestWithDB import BaseTestWithDB
+from django.urls import reverse
+from resources.utils import (
+    update_resource_facets,
+    get_facet_counts,
+    get_search_suggestions,
+)
+from utils.cache_utils import get_content_version
+from resources.models import (
+    Resource,
+    Language,
+    YearLevel,
+)
+
+
+class ResourceFacetsTest(BaseTestWithDB):
+    """Test class for denormalised resource facet fields."""
+
+    def setUp(self):
+        super().setUp()
+        self.language_1 = Language.objects.create(name='language-1', css_class='lang-1')
+        self.language_2 = Language.objects.create(name='language-2', css_class='lang-2')
+        self.resource = Resource.objects.create(name='resource-1', description='description')
+
+    def test_facets_updated_on_add(self):
+        self.resource.languages.add(self.language_1, self.language_2)
+        self.resource.refresh_from_db()
+        self.assertEqual(
+            sorted(self.resource.language_ids),
+            sorted([self.language_1.pk, self.language_2.pk])
+        )
+
+    def test_facets_updated_on_remove(self):
+        self.resource.languages.add(self.language_1, self.language_2)
+        self.resource.languages.remove(self.language_1)
+        self.resource.refresh_from_db()
+        self.assertEqual(self.resource.language_ids, [self.language_2.pk])
+
+    def test_facets_updated_on_reverse_add(self):
+        year_level = YearLevel.objects.create(level=1)
+        year_level.resources.add(self.resource)
+        self.resource.refresh_from_db()
+        self.assertEqual(self.resource.year_level_ids, [year_level.pk])
+
+    def test_facets_updated_on_reverse_clear(self):
+        self.resource.languages.add(self.language_1, self.language_2)
+        self.language_1.resources.clear()
+        self.resource.refresh_from_db()
+        self.assertEqual(self.resource.language_ids, [self.language_2.pk])
+
+    def test_facets_kept_on_save_of_stale_instance(self):
+        self.resource.languages.add(self.language_1)
+        self.resource.name = 'resource-2'
+        self.resource.save()
+        self.resource.refresh_from_db()
+        self.assertEqual(self.resource.language_ids, [self.language_1.pk])
+
+    def test_update_resource_facets_all_fields(self):
+        self.resource.languages.add(self.language_1)
+        Resource.objects.filter(pk=self.resource.pk).update(language_ids=[])
+        update_resource_facets([self.resource.pk])
+        self.resource.refresh_from_db()
+        self.assertEqual(self.resource.language_ids, [self.language_1.pk])
+        self.assertEqual(self.resource.year_level_ids, [])
+
+    def test_facet_filter_matches_any_selected(self):
+        self.resource.languages.add(self.language_1)
+        other_resource = Resource.objects.create(name='resource-2', description='description')
+        other_resource.languages.add(self.language_2)
+        self.assertEqual(
+            list(Resource.objects.filter(language_ids__overlap=[self.language_1.pk])),
+            [self.resource]
+        )
+
+    def test_facet_counts(self):
+        self.resource.languages.add(self.language_1)
+        year_level = YearLevel.objects.create(level=1)
+        self.resource.year_levels.add(year_level)
+        other_resource = Resource.objects.create(name='resource-2', description='description')
+        other_resource.languages.add(self.language_2)
+        facet_counts = get_facet_counts(
+            Resource.objects.all(),
+            {'language_ids': [self.language_1.pk]},
+        )
+        # Selected languages do not restrict language counts
+        self.assertEqual(
+            facet_counts['language_ids'],
+            {self.language_1.pk: 1, self.language_2.pk: 1}
+        )
+        self.assertEqual(facet_counts['year_level_ids'], {year_level.pk: 1})
+        self.assertEqual(facet_counts['nzqa_standard_ids'], {})
+
+
+class ContentVersionTest(BaseTestWithDB):
+    """Test class for resource content version."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_content_version_unchanged_without_changes(self):
+        self.assertEqual(get_content_version('resources'), get_content_version('resources'))
+
+    def test_content_version_changed_on_commit(self):
+        version = get_content_version('resources')
+        with self.captureOnCommitCallbacks(execute=True):
+            Resource.objects.create(name='resource-1', description='description')
+        self.assertNotEqual(get_content_version('resources'), version)
+
+    def test_content_version_changed_on_language_created(self):
+        version = get_content_version('resources')
+        with self.captureOnCommitCallbacks(execute=True):
+            Language.objects.create(name='language-1', css_class='lang-1')
+        self.assertNotEqual(get_content_version('resources'), version)
+
+
+class SearchSuggestionsTest(BaseTestWithDB):
+    """Test class for get_search_suggestions function."""
+
+    def setUp(self):
+        super().setUp()
+        self.resource = Resource.objects.create(name='Binary numbers', description='description', published=True)
+        Resource.objects.create(name='Binary secrets', description='description', published=False)
+        self.language = Language.objects.create(name='Python', css_class='lang-1')
+
+    def test_suggestions_partial_word(self):
+        suggestions = get_search_suggestions('binar')
+        self.assertEqual(
+            suggestions,
+            [{'name': 'Binary numbers', 'type': 'Resource', 'url': self.resource.get_absolute_url()}]
+        )
+
+    def test_suggestions_tag(self):
+        suggestions = get_search_suggestions('pytho')
+        self.assertEqual(len(suggestions), 1)
+        self.assertEqual(suggestions[0]['name'], 'Python')
+        self.assertEqual(
+            suggestions[0]['url'],
+            '{}?lang={}'.format(reverse('resources:search'), self.language.pk)
+        )
+
+    def test_suggestions_no_match(self):
+        self.assertEqual(get_search_suggestions('zebra'), [])
+
+    def test_suggestions_limit(self):
+        for number in range(5):
+            Language.objects.create(name='Python {}'.format(number), css_class='lang')
+        self.assertEqual(len(get_search_suggestions('python', limit=3)), 3)
@@ -0,0 +1,35 @@
+"""Test class for resources views module."""
+
+from django.urls import reverse
+from tests.BaseTestWithDB import BaseTestWithDB
+from resources.models import (
+    Resource,
+    Language,
+)
+
+
+class SearchSuggestionsJSONTest(BaseTestWithDB):
+    """Test class for search suggestions JSON view."""
+
+    def setUp(self):
+        super().setUp()
+        Resource.objects.create(name='Binary numbers', description='description', published=True)
+
+    def get_suggestions(self, query_text=None):
+        parameters = {} if query_text is None else {'q': query_text}
+        response = self.client.get(reverse('resources:search_suggestions'), parameters)
+        self.assertEqual(response.status_code, 200)
+        return response.json()['suggestions']
+
+    def test_search_suggestions(self):
+        suggestions = self.get_suggestions('binar')
+        self.assertEqual([suggestion['name'] for suggestion in suggestions], ['Binary numbers'])
+
+    def test_search_suggestions_empty_query(self):
+        self.assertEqual(self.get_suggestions(), [])
+        self.assertEqual(self.get_suggestions('  '), [])
+
+    def test_search_suggestions_short_query(self):
+        # Matches a language name, but is shorter than the minimum length
+        Language.objects.create(name='C', css_class='lang-c')
+        self.assertEqual(self.get_suggestions('c'), [])
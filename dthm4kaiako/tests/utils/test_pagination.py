@@ -0,0 +1,98 @@
+"""Test class for pagination module."""
+
+from tests.BaseTestWithDB import BaseTestWithDB
+from utils.pagination import (
+    KeysetPaginator,
+    InvalidCursor,
+)
+from datetime import timedelta
+from django.utils.timezone import now
+from resources.models import Language
+from events.models import Event
+
+
+class KeysetPaginatorTest(BaseTestWithDB):
+    """Test class for KeysetPaginator class."""
+
+    def setUp(self):
+        super().setUp()
+        # Duplicate names check the unique final ordering field is used
+        for name in ['c', 'a', 'b', 'a', 'c']:
+            Language.objects.create(name=name, css_class='css')
+
+    def get_all_pages(self, paginator):
+        pages = []
+        page = paginator.get_page()
+        pages.append([language.name for language in page])
+        while page.has_next():
+            page = paginator.get_page(page.next_cursor)
+            pages.append([language.name for language in page])
+        return pages
+
+    def test_keyset_paginator_ascending(self):
+        paginator = KeysetPaginator(Language.objects.all(), ('name', 'pk'), 2)
+        self.assertEqual(
+            self.get_all_pages(paginator),
+            [['a', 'a'], ['b', 'c'], ['c']]
+        )
+
+    def test_keyset_paginator_descending(self):
+        paginator = KeysetPaginator(Language.objects.all(), ('-name', '-pk'), 2)
+        self.assertEqual(
+            self.get_all_pages(paginator),
+            [['c', 'c'], ['b', 'a'], ['a']]
+        )
+
+    def test_keyset_paginator_single_page(self):
+        paginator = KeysetPaginator(Language.objects.all(), ('name', 'pk'), 5)
+        page = paginator.get_page()
+        self.assertEqual(len(page), 5)
+        self.assertFalse(page.has_next())
+
+    def test_keyset_paginator_invalid_cursor(self):
+        paginator = KeysetPaginator(Language.objects.all(), ('name', 'pk'), 2)
+        with self.assertRaises(InvalidCursor):
+            paginator.get_page('invalid')
+
+    def test_keyset_paginator_approximate_count(self):
+        paginator = KeysetPaginator(Language.objects.all(), ('name', 'pk'), 2, count_limit=3)
+        self.assertEqual(paginator.approximate_count(), (3, True))
+        paginator = KeysetPaginator(Language.objects.all(), ('name', 'pk'), 2)
+        self.assertEqual(paginator.approximate_count(), (5, False))
+
+
+class KeysetPaginatorNullValuesTest(BaseTestWithDB):
+    """Test class for KeysetPaginator class ordering null values."""
+
+    def setUp(self):
+        super().setUp()
+        start = now()
+        for name, days in [('null-1', None), ('day-2', 2), ('day-1', 1), ('null-2', None)]:
+            Event.objects.create(
+                name=name,
+                description='description',
+                start=None if days is None else start + timedelta(days=days),
+            )
+
+    def get_all_names(self, paginator):
+        names = []
+        page = paginator.get_page()
+        names += [event.name for event in page]
+        while page.has_next():
+            page = paginator.get_page(page.next_cursor)
+            names += [event.name for event in page]
+        return names
+
+    def test_keyset_paginator_null_values_ascending(self):
+        paginator = KeysetPaginator(Event.objects.all(), ('start', 'pk'), 1)
+        self.assertEqual(
+            self.get_all_names(paginator),
+            ['day-1', 'day-2', 'null-1', 'null-2']
+        )
+
+    def test_keyset_paginator_null_values_descending(self):
+        paginator = KeysetPaginator(Event.objects.all(), ('-start', '-pk'), 1)
+        self.assertEqual(
+            self.get_all_names(paginator),
+            ['null-2', 'null-1', 'day-2', 'day-1']
+        )
@@ -3,153 +3,89 @@
 from tests.BaseTestWithDB import BaseTestWithDB
 from utils import search_utils
 from resources.models import (
+    Resource,
+    Language,
     TechnologicalArea,
-    ProgressOutcome,
 )
 
 
-class ConcatFieldValuesTest(BaseTestWithDB):
-    """Test class for concat_field_values module."""
+class QueueSearchIndexUpdateTest(BaseTestWithDB):
+    """Test class for queue_search_index_update function."""
 
-    def test_concat_field_values_one_queryset_one_field(self):
-        TechnologicalArea.objects.create(
-            name='techarea-1',
-            abbreviation='ta-1',
-            css_class='ta-css-1',
-        )
-        TechnologicalArea.objects.create(
-            name='techarea-2',
-            abbreviation='ta-2',
-            css_class='ta-css-2',
-        )
-        TechnologicalArea.objects.create(
-            name='techarea-3',
-            abbreviation='ta-3',
-            css_class='ta-css-3',
-        )
-        qs1 = TechnologicalArea.objects.values_list('name')
-        self.assertEqual(
-            search_utils.concat_field_values(qs1),
-            'techarea-1 techarea-2 techarea-3'
-        )
+    def get_search_index_callbacks(self, callbacks):
+        # Other commit callbacks, such as cache invalidation, are ignored
+        return [callback for callback in callbacks if isinstance(callback, search_utils.SearchIndexUpdateQueue)]
 
-    def test_concat_field_values_one_queryset_multiple_fields(self):
-        TechnologicalArea.objects.create(
-            name='techarea-1',
-            abbreviation='ta-1',
-            css_class='ta-css-1',
-        )
-        TechnologicalArea.objects.create(
-            name='techarea-2',
-            abbreviation='ta-2',
-            css_class='ta-css-2',
-        )
-        TechnologicalArea.objects.create(
-            name='techarea-3',
-            abbreviation='ta-3',
-            css_class='ta-css-3',
-        )
-        qs1 = TechnologicalArea.objects.values_list('name', 'abbreviation')
+    def test_queue_search_index_update_once_per_transaction(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            resource = Resource.objects.create(name='resource-1', description='description')
+            language = Language.objects.create(name='language-1', css_class='lang-1')
+            resource.languages.add(language)
+            resource.name = 'resource-2'
+            resource.save()
+        self.assertEqual(len(self.get_search_index_callbacks(callbacks)), 1)
         self.assertEqual(
-            search_utils.concat_field_values(qs1),
-            'techarea-1 ta-1 techarea-2 ta-2 techarea-3 ta-3'
+            list(Resource.objects.filter(search_vector='resource-2 language-1')),
+            [resource]
         )
 
-    def test_concat_field_values_multiple_querysets_one_field(self):
-        ta1 = TechnologicalArea.objects.create(
-            name='techarea-1',
-            abbreviation='ta-1',
-            css_class='ta-css-1',
-        )
-        ta2 = TechnologicalArea.objects.create(
-            name='techarea-2',
-            abbreviation='ta-2',
-            css_class='ta-css-2',
-        )
-        TechnologicalArea.objects.create(
-            name='techarea-3',
-            abbreviation='ta-3',
-            css_class='ta-css-3',
-        )
-        qs1 = TechnologicalArea.objects.values_list('name')
-        ProgressOutcome.objects.create(
-            name='progressoutcome-1',
-            abbreviation='po-1',
-            technological_area=ta1,
-            css_class='po-css-1',
-        )
-        ProgressOutcome.objects.create(
-            name='progressoutcome-2',
-            abbreviation='po-2',
-            technological_area=ta2,
-            css_class='po-css-2',
-        )
-        qs2 = ProgressOutcome.objects.values_list('name')
+    def test_queue_search_index_update_multiple_objects(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            resource_1 = Resource.objects.create(name='resource-1', description='description')
+            resource_2 = Resource.objects.create(name='resource-2', description='description')
+            search_utils.queue_search_index_update(Resource, [resource_1.pk, resource_2.pk])
+        self.assertEqual(len(self.get_search_index_callbacks(callbacks)), 1)
         self.assertEqual(
-            search_utils.concat_field_values(qs1, qs2),
-            'techarea-1 techarea-2 techarea-3 progressoutcome-1 progressoutcome-2'
+            Resource.objects.filter(search_vector='description').count(),
+            2
         )
 
-    def test_concat_field_values_multiple_querysets_multiple_fields(self):
-        ta1 = TechnologicalArea.objects.create(
-            name='techarea-1',
-            abbreviation='ta-1',
-            css_class='ta-css-1',
-        )
-        ta2 = TechnologicalArea.objects.create(
-            name='techarea-2',
-            abbreviation='ta-2',
-            css_class='ta-css-2',
-        )
-        TechnologicalArea.objects.create(
-            name='techarea-3',
-            abbreviation='ta-3',
-            css_class='ta-css-3',
-        )
-        qs1 = TechnologicalArea.objects.values_list('name', 'abbreviation')
-        ProgressOutcome.objects.create(
-            name='progressoutcome-1',
-            abbreviation='po-1',
-            technological_area=ta1,
-            css_class='po-css-1',
-        )
-        ProgressOutcome.objects.create(
-            name='progressoutcome-2',
-            abbreviation='po-2',
-            technological_area=ta2,
-            css_class='po-css-2',
-        )
-        qs2 = ProgressOutcome.objects.values_list('name', 'css_class')
+    def test_related_object_rename_queues_update(self):
+        resource = Resource.objects.create(name='resource-1', description='description')
+        language = Language.objects.create(name='language-1', css_class='lang-1')
+        resource.languages.add(language)
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            language.name = 'renamed'
+            language.save()
+        self.assertEqual(len(self.get_search_index_callbacks(callbacks)), 1)
         self.assertEqual(
-            search_utils.concat_field_values(qs1, qs2),
-            'techarea-1 ta-1 techarea-2 ta-2 techarea-3 ta-3 progressoutcome-1 po-css-1 progressoutcome-2 po-css-2'
+            list(Resource.objects.filter(search_vector='renamed')),
+            [resource]
         )
 
-    def test_concat_field_values_multiple_querysets_relationship_field(self):
-        ta1 = TechnologicalArea.objects.create(
+    def test_related_object_unindexed_field_save_ignored(self):
+        resource = Resource.objects.create(name='resource-1', description='description')
+        language = Language.objects.create(name='language-1', css_class='lang-1')
+        resource.languages.add(language)
+        with self.captureOnCommitCallbacks() as callbacks:
+            language.css_class = 'lang-2'
+            language.save(update_fields=['css_class'])
+        self.assertEqual(len(self.get_search_index_callbacks(callbacks)), 0)
+
+
+class UpdateSearchIndexesTest(BaseTestWithDB):
+    """Test class for update_search_indexes function."""
+
+    def test_update_search_indexes_related_values(self):
+        resource = Resource.objects.create(name='resource-1', description='description')
+        technological_area = TechnologicalArea.objects.create(
             name='techarea-1',
-            abbreviation='ta-1',
+            abbreviation='tarea',
             css_class='ta-css-1',
         )
-        ta2 = TechnologicalArea.objects.create(
-            name='techarea-2',
-            abbreviation='ta-2',
-            css_class='ta-css-2',
-        )
-        ProgressOutcome.objects.create(
-            name='progressoutcome-1',
-            abbreviation='po-1',
-            technological_area=ta1,
-            css_class='po-css-1',
-        )
-        ProgressOutcome.objects.create(
-            name='progressoutcome-2',
-            abbreviation='po-2',
-            technological_area=ta2,
-            css_class='po-css-2',
-        )
-        qs1 = ProgressOutcome.objects.values_list('name', 'technological_area__name')
+        resource.technological_areas.add(technological_area)
+        resource.year_levels.create(level=13)
+        search_utils.update_search_indexes(Resource, [resource.pk])
+        for text in ['resource-1', 'description', 'techarea-1', 'tarea', '13']:
+            self.assertEqual(
+                list(Resource.objects.filter(search_vector=text)),
+                [resource]
+            )
+
+    def test_update_search_indexes_no_related_values(self):
+        resource = Resource.objects.create(name='resource-1', description='description')
+        search_utils.update_search_indexes(Resource, [resource.pk])
         self.assertEqual(
-            search_utils.concat_field_values(qs1),
-            'progressoutcome-1 techarea-1 progressoutcome-2 techarea-2'
+            list(Resource.objects.filter(search_vector='resource-1')),
+            [resource]
         )
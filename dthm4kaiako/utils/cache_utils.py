@@ -0,0 +1,55 @@
+"""Cache utility functions."""
+
+from functools import partial
+from time import time_ns
+from django.core.cache import cache
+from django.db import transaction
+
+CONTENT_VERSION_CACHE_KEY = 'content-version:{}'
+
+
+def get_content_version(name):
+    """Return version number of content.
+
+    The version is changed whenever the content changes, so it can be
+    used in cache keys of data derived from the content.
+
+    Args:
+        name (str): Name of content, for example 'resources'.
+
+    Returns:
+        Version number (int).
+    """
+    key = CONTENT_VERSION_CACHE_KEY.format(name)
+    version = cache.get(key)
+    if version is None:
+        # Start from the current time so a version lost from the cache
+        # is never reused.
+        cache.add(key, time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def increment_content_version(name):
+    """Change version number of content.
+
+    Args:
+        name (str): Name of content.
+    """
+    key = CONTENT_VERSION_CACHE_KEY.format(name)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time_ns(), None)
+
+
+def invalidate_content_version(name):
+    """Change version number of content once changes are committed.
+
+    Waiting for the commit prevents other requests caching
+    uncommitted content under the new version.
+
+    Args:
+        name (str): Name of content.
+    """
+    transaction.on_commit(partial(increment_content_version, name))
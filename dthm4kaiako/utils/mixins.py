@@ -1,6 +1,8 @@
 """Mixins used by Django system."""
 
+from django.http import Http404
 from django.shortcuts import redirect
+from utils.pagination import KeysetPaginator, InvalidCursor
 
 
 class RedirectToCosmeticURLMixin(object):
@@ -36,3 +38,56 @@ class RedirectToCosmeticURLMixin(object):
         else:
             context = self.get_context_data(object=self.object)
             return self.render_to_response(context)
+
+
+class KeysetPaginationMixin(object):
+    """Mixin for a list view that paginates objects by keyset.
+
+    Pages are requested with the 'cursor' query parameter, and the
+    view's 'keyset_ordering' attribute sets the ordering of objects.
+    """
+
+    paginate_by = 20
+    keyset_ordering = ('pk', )
+
+    def paginate_queryset(self, queryset, page_size):
+        """Paginate the queryset by keyset.
+
+        Returns:
+            Tuple of paginator, page, objects in page, and if
+            pagination is required.
+
+        Raises:
+            Http404 if page cursor is invalid.
+        """
+        paginator = KeysetPaginator(queryset, self.keyset_ordering, page_size)
+        try:
+            page = paginator.get_page(self.request.GET.get('cursor'))
+        except InvalidCursor:
+            raise Http404('Invalid page cursor.')
+        is_paginated = page.has_next() or 'cursor' in self.request.GET
+        return (paginator, page, page.object_list, is_paginated)
+
+    def get_context_data(self, **kwargs):
+        """Provide the context data for the paginated view.
+
+        Adds the approximate number of objects, and query strings
+        for the first and next page.
+
+        Returns:
+            Dictionary of context data.
+        """
+        context = super().get_context_data(**kwargs)
+        page = context.get('page_obj')
+        if page is not None:
+            object_count, object_count_limited = context['paginator'].approximate_count()
+            context['object_count'] = object_count
+            context['object_count_limited'] = object_count_limited
+            page_query = self.request.GET.copy()
+            page_query.pop('cursor', None)
+            if 'cursor' in self.request.GET:
+                context['first_page_query'] = page_query.urlencode()
+            if page.has_next():
+                page_query['cursor'] = page.next_cursor
+                context['next_page_query'] = page_query.urlencode()
+        return context
@@ -0,0 +1,195 @@
+"""Keyset pagination for querysets.
+
+Keyset pagination filters on the ordering values of the last object of the
+previous page, rather than using an offset. This allows the database to use
+indexes for each page, keeping response times constant for any page.
+"""
+
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from datetime import date
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage
+from django.db.models import F, Q
+
+
+class InvalidCursor(InvalidPage):
+    """Raised when a cursor cannot be decoded for a paginator."""
+
+    pass
+
+
+class KeysetPage():
+    """Page of objects from a keyset paginator."""
+
+    def __init__(self, object_list, next_cursor):
+        """Create page object.
+
+        Args:
+            object_list (list): Objects in page.
+            next_cursor (str): Cursor for next page, None if last page.
+        """
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+
+    def has_next(self):
+        """Return true if a following page exists."""
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        """Iterate over objects in page."""
+        return iter(self.object_list)
+
+    def __len__(self):
+        """Return number of objects in page."""
+        return len(self.object_list)
+
+
+class KeysetPaginator():
+    """Paginator using the ordering values of objects as page cursors."""
+
+    def __init__(self, queryset, ordering, per_page, count_limit=1000):
+        """Create paginator object.
+
+        Args:
+            queryset (QuerySet): Objects to paginate.
+            ordering (tuple): Field names to order objects by, with a '-'
+                prefix for descending order. The final field must be unique,
+                for example 'pk'. Annotated values can be used.
+            per_page (int): Number of objects per page.
+            count_limit (int): Maximum number of objects to count.
+        """
+        self.queryset = queryset
+        self.ordering = ordering
+        self.per_page = per_page
+        self.count_limit = count_limit
+
+    def get_page(self, cursor=None):
+        """Return page of objects after the given cursor.
+
+        Args:
+            cursor (str): Cursor from previous page, or None for first page.
+
+        Returns:
+            KeysetPage object.
+
+        Raises:
+            InvalidCursor if cursor is invalid.
+        """
+        queryset = self.queryset.order_by(*self.get_order_by())
+        if cursor:
+            values = self.decode_cursor(cursor)
+            try:
+                queryset = queryset.filter(self.get_keyset_filter(values))
+            except (TypeError, ValueError, ValidationError):
+                raise InvalidCursor('Invalid page cursor')
+        object_list = list(queryset[:self.per_page + 1])
+        next_cursor = None
+        if len(object_list) > self.per_page:
+            object_list = object_list[:self.per_page]
+            next_cursor = self.encode_cursor(object_list[-1])
+        return KeysetPage(object_list, next_cursor)
+
+    def approximate_count(self):
+        """Return number of objects, counting at most the count limit.
+
+        Returns:
+            Tuple of count (int) and if the count limit was reached (bool).
+        """
+        count = self.queryset.order_by()[:self.count_limit].count()
+        return (count, count >= self.count_limit)
+
+    def get_order_by(self):
+        """Return ordering expressions, with null values ordered explicitly.
+
+        Null values are ordered as by default in PostgreSQL, so indexes
+        on the ordering fields can still be used.
+
+        Returns:
+            List of ordering expressions.
+        """
+        order_by = []
+        for field in self.ordering:
+            if field.startswith('-'):
+                order_by.append(F(field[1:]).desc(nulls_first=True))
+            else:
+                order_by.append(F(field).asc(nulls_last=True))
+        return order_by
+
+    def get_keyset_filter(self, values):
+        """Return filter for objects ordered after the given values.
+
+        Null values are ordered after all other values in ascending order,
+        and before all other values in descending order.
+
+        Args:
+            values (list): Ordering values of last object of previous page.
+
+        Returns:
+            Q object.
+        """
+        keyset_filter = Q()
+        for i, field in enumerate(self.ordering):
+            field_name = field.lstrip('-')
+            value = values[i]
+            if field.startswith('-'):
+                if value is None:
+                    after_filter = Q(**{field_name + '__isnull': False})
+                else:
+                    after_filter = Q(**{field_name + '__lt': value})
+            elif value is None:
+                # No values are ordered after null values
+                continue
+            else:
+                after_filter = Q(**{field_name + '__gt': value}) | Q(**{field_name + '__isnull': True})
+            field_filter = Q()
+            for j in range(i):
+                previous_field_name = self.ordering[j].lstrip('-')
+                if values[j] is None:
+                    field_filter &= Q(**{previous_field_name + '__isnull': True})
+                else:
+                    field_filter &= Q(**{previous_field_name: values[j]})
+            keyset_filter |= field_filter & after_filter
+        return keyset_filter
+
+    def encode_cursor(self, obj):
+        """Return cursor containing ordering values of the given object.
+
+        Args:
+            obj: Object to create cursor for.
+
+        Returns:
+            Cursor string.
+        """
+        values = []
+        for field in self.ordering:
+            value = getattr(obj, field.lstrip('-'))
+            if isinstance(value, date):
+                value = value.isoformat()
+            values.append(value)
+        return urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    def decode_cursor(self, cursor):
+        """Return ordering values from cursor string.
+
+        Args:
+            cursor (str): Cursor string.
+
+        Returns:
+            List of ordering values.
+
+        Raises:
+            InvalidCursor if cursor is invalid.
+        """
+        try:
+            values = json.loads(urlsafe_b64decode(cursor.encode()))
+        except (BinasciiError, UnicodeError, ValueError):
+            raise InvalidCursor('Invalid page cursor')
+        if (
+            not isinstance(values, list) or
+            len(values) != len(self.ordering) or
+            not all(value is None or isinstance(value, (str, int, float)) for value in values)
+        ):
+            raise InvalidCursor('Invalid page cursor')
+        return values
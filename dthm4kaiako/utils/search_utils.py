@@ -1,43 +1,163 @@
 """Search utility functions."""
 
-from django.db.models import Value
+import logging
+import weakref
+from collections import defaultdict
+from threading import local
+from django.db import transaction
+from django.db.models import (
+    BooleanField,
+    F,
+    Func,
+    OuterRef,
+    Subquery,
+    TextField,
+    Value,
+)
+from django.db.models.functions import Cast, Concat
+from django.contrib.postgres.aggregates import StringAgg
 from django.contrib.postgres.search import SearchVector
 
+SEARCH_INDEX_UPDATE_CHUNK_SIZE = 500
+logger = logging.getLogger(__name__)
+_search_index_queues = local()
 
-def concat_field_values(*args):
-    """Return string of field values for search indexing.
+
+def related_field_values(model, field_name, *related_field_names):
+    """Return subquery of field values of related objects for search indexing.
 
     Args:
-        Any number of QuerySet objects, the result of value_list calls.
+        model (Model): Model class of objects being indexed.
+        field_name (str): Name of many to many field on model.
+        related_field_names (str): Names of fields on related model to index.
 
     Returns:
-        String for search indexing.
+        Subquery expression of text of related field values, separated by spaces.
     """
-    field_names = []
-    for queryset in args:
-        for instance in queryset:
-            for field in instance:
-                field_names.append(str(field))
-    return ' '.join(field_names)
-
-
-def get_search_index_updater(instance):
-    """Return function for updating search index of instance."""
-    components = instance.index_contents()
-    pk = instance.pk
-
-    def on_commit():
-        search_vector_list = []
-        for weight, text in components.items():
-            search_vector_list.append(
-                SearchVector(Value(text), weight=weight)
-            )
-        search_vectors = search_vector_list[0]
-        for search_vector in search_vector_list[1:]:
+    field = model._meta.get_field(field_name)
+    values = [
+        F('{}__{}'.format(field.m2m_reverse_field_name(), related_field_name))
+        for related_field_name in related_field_names
+    ]
+    if len(values) > 1:
+        text_parts = [values[0]]
+        for value in values[1:]:
+            text_parts += [Value(' '), value]
+        text = Concat(*text_parts)
+    else:
+        text = Cast(values[0], TextField())
+    related_text = field.remote_field.through.objects.filter(
+        **{field.m2m_field_name(): OuterRef('pk')}
+    ).order_by().values(field.m2m_field_name()).annotate(
+        text=StringAgg(text, delimiter=' ')
+    ).values('text')
+    return Subquery(related_text, output_field=TextField())
+
+
+def get_search_vector(model):
+    """Return expression of weighted search vector for objects of model.
+
+    Args:
+        model (Model): Model class of objects, which defines an
+            index_contents method.
+
+    Returns:
+        Search vector expression.
+    """
+    search_vectors = None
+    for weight, expressions in model.index_contents().items():
+        search_vector = SearchVector(*expressions, weight=weight)
+        if search_vectors is None:
+            search_vectors = search_vector
+        else:
             search_vectors += search_vector
+    return search_vectors
+
+
+def update_search_indexes(model, pks):
+    """Rebuild search indexes of objects in chunked queries.
+
+    The search vectors are computed within the database, so no content
+    is transferred to the application. Large numbers of objects are
+    updated in chunks to avoid long running statements.
+
+    Args:
+        model (Model): Model class of objects, which defines an
+            index_contents method.
+        pks (iterable): Primary keys of objects to update.
+    """
+    pks = sorted(set(pks))
+    count = 0
+    for i in range(0, len(pks), SEARCH_INDEX_UPDATE_CHUNK_SIZE):
+        count += model.objects.filter(
+            pk__in=pks[i:i + SEARCH_INDEX_UPDATE_CHUNK_SIZE]
+        ).update(search_vector=get_search_vector(model))
+    logger.info('Rebuilt search indexes for {} {} objects'.format(count, model.__name__))
+
 
-        instance.__class__.objects.filter(pk=pk).update(
-            search_vector=search_vectors
+def update_search_index_range(model, start_pk, end_pk, changed_only=True):
+    """Rebuild search indexes of objects within a primary key range.
+
+    Args:
+        model (Model): Model class of objects, which defines an
+            index_contents method.
+        start_pk (int): First primary key of range (inclusive).
+        end_pk (int): Last primary key of range (exclusive).
+        changed_only (bool): Only write rows where the search vector
+            has changed, avoiding row locks for unchanged rows.
+
+    Returns:
+        Number of objects updated.
+    """
+    objects = model.objects.filter(pk__gte=start_pk, pk__lt=end_pk)
+    search_vector = get_search_vector(model)
+    if changed_only:
+        objects = objects.filter(
+            Func(
+                F('search_vector'),
+                search_vector,
+                template='%(expressions)s',
+                arg_joiner=' IS DISTINCT FROM ',
+                output_field=BooleanField(),
+            )
         )
-        print(f'Rebuilt index for {instance}')
-    return on_commit
+    return objects.update(search_vector=search_vector)
+
+
+class SearchIndexUpdateQueue():
+    """Queue of objects requiring search index updates once committed."""
+
+    def __init__(self):
+        """Create empty queue."""
+        self.pks = defaultdict(set)
+        self.done = False
+
+    def __call__(self):
+        """Rebuild search indexes of all queued objects."""
+        self.done = True
+        for model, pks in self.pks.items():
+            update_search_indexes(model, pks)
+
+
+def queue_search_index_update(model, pks):
+    """Queue search index update of objects until transaction is committed.
+
+    Updates are collected for the current transaction, so each object is
+    only reindexed once when the transaction is committed, regardless of
+    how many times it was queued.
+
+    Args:
+        model (Model): Model class of objects.
+        pks (iterable): Primary keys of objects to update.
+    """
+    queue_ref = getattr(_search_index_queues, 'queue', None)
+    queue = queue_ref() if queue_ref else None
+    if queue is None or queue.done:
+        queue = SearchIndexUpdateQueue()
+        queue.pks[model].update(pks)
+        # Only the commit callback holds a strong reference to the queue,
+        # so the queue is discarded if the transaction is rolled back.
+        _search_index_queues.queue = weakref.ref(queue)
+        transaction.on_commit(queue)
+    else:
+        queue.pks[model].update(pks)